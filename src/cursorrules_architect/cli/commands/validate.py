@@ -4,6 +4,7 @@ Validate command for checking existing configuration files.
 Validates syntax and provides recommendations for AI tool configurations.
 """
 
+from collections import Counter
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 import typer
@@ -182,8 +183,9 @@ def validate_configuration_file(config_info: Dict[str, Any], detailed: bool) ->
             status = "✅ Valid"
             console.print("  [green]✅ No issues found[/]")
         else:
-            error_count = len([i for i in issues if i["severity"] == "error"])
-            warning_count = len([i for i in issues if i["severity"] == "warning"])
+            severity_counts = Counter(i["severity"] for i in issues)
+            error_count = severity_counts["error"]
+            warning_count = severity_counts["warning"]
             
             if error_count > 0:
                 status = f"❌ {error_count} errors, {warning_count} warnings"
@@ -115,10 +115,11 @@ class AnthropicArchitect(BaseArchitect):
         Returns:
             Formatted prompt string
         """
+        template, context = self._resolve_prompt_template(context)
         responsibilities_str = "\n".join(f"- {r}" for r in self.responsibilities)
         context_str = json.dumps(context, indent=2)
         
-        return self.prompt_template.format(
+        return template.format(
             agent_name=self.name or "Claude Architect",
             agent_role=self.role or "analyzing the project",
             agent_responsibilities=responsibilities_str,
@@ -15,7 +15,7 @@ This module serves as the foundation for all model interactions in the CursorRul
 from abc import ABC, abstractmethod
 import logging
 from enum import Enum
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 
 # ====================================================
 # Type Definitions
@@ -95,6 +95,26 @@ class BaseArchitect(ABC):
         self.name = name
         self.role = role
         self.responsibilities = responsibilities or []
+    
+    def _resolve_prompt_template(self, context: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Select the prompt template to use for a single call.
+        
+        A "prompt_template" entry in the context (e.g. a blueprint-enhanced template)
+        overrides the architect's own template for that call only, so concurrent
+        calls never need to swap the shared attribute. The entry is removed from the
+        returned context so it is not rendered into the prompt.
+        
+        Args:
+            context: Dictionary containing the context for analysis
+            
+        Returns:
+            Tuple of (template, context without the template override)
+        """
+        if isinstance(context, dict) and "prompt_template" in context:
+            context = dict(context)
+            return context.pop("prompt_template"), context
+        return self.prompt_template, context
         
     @abstractmethod
     async def analyze(self, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -90,9 +90,10 @@ Provide your analysis in a structured format with clear sections and actionable
 
     def format_prompt(self, context: Dict[str, Any]) -> str:
         """Format the analysis prompt with the provided context."""
+        template, context = self._resolve_prompt_template(context)
         responsibilities_text = "\n".join([f"- {r}" for r in self.responsibilities]) if self.responsibilities else "Analyzing code architecture and patterns"
         
-        return self.prompt_template.format(
+        return template.format(
             agent_name=self.name or "DeepSeek Reasoner",
             agent_role=self.role or "code architecture analysis",
             agent_responsibilities=responsibilities_text,
@@ -130,10 +130,11 @@ Format your response as a structured report with clear sections and findings."""
         Returns:
             Formatted prompt string
         """
+        template, context = self._resolve_prompt_template(context)
         responsibilities_str = "\n".join(f"- {r}" for r in self.responsibilities) if self.responsibilities else ""
         context_str = json.dumps(context, indent=2) if isinstance(context, dict) else str(context)
         
-        return self.prompt_template.format(
+        return template.format(
             agent_name=self.name or "OpenAI Architect",
             agent_role=self.role or "analyzing the project",
             agent_responsibilities=responsibilities_str,
@@ -10,12 +10,127 @@ that describe tasks, agent roles, and evaluation criteria before any model invoc
 # ====================================================
 
 import json
-import yaml
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 import logging
 
+# ====================================================
+# Phase Task Tables
+# Stored column-wise (one tuple per field) so readers can iterate only
+# the fields they need; _generate_tasks materializes the dict form.
+# ====================================================
+
+_PHASE_TASKS = {
+    "phase1": SimpleNamespace(
+        ids=("T1.1", "T1.2", "T1.3"),
+        names=(
+            "Directory Structure Analysis",
+            "Dependency Investigation",
+            "Technology Stack Identification",
+        ),
+        descriptions=(
+            "Analyze and map the complete directory structure",
+            "Identify all project dependencies and their versions",
+            "Identify all frameworks, libraries, and technologies used",
+        ),
+        priorities=("high", "high", "high"),
+        dependencies=((), (), ("T1.1", "T1.2")),
+        expected_outputs=(
+            "Structured directory tree with annotations",
+            "Dependency graph with version compatibility analysis",
+            "Comprehensive tech stack documentation",
+        ),
+    ),
+    "phase2": SimpleNamespace(
+        ids=("T2.1", "T2.2"),
+        names=(
+            "Analysis Plan Creation",
+            "Resource Allocation",
+        ),
+        descriptions=(
+            "Create detailed analysis plan based on Phase 1 findings",
+            "Allocate computational and agent resources",
+        ),
+        priorities=("high", "medium"),
+        dependencies=(("phase1",), ("T2.1",)),
+        expected_outputs=(
+            "Structured analysis plan with agent assignments",
+            "Resource allocation matrix",
+        ),
+    ),
+    "phase3": SimpleNamespace(
+        ids=("T3.1", "T3.2"),
+        names=(
+            "Component Deep Dive",
+            "Pattern Recognition",
+        ),
+        descriptions=(
+            "Perform deep analysis of identified components",
+            "Identify architectural patterns and anti-patterns",
+        ),
+        priorities=("high", "medium"),
+        dependencies=(("phase2",), ("T3.1",)),
+        expected_outputs=(
+            "Detailed component analysis reports",
+            "Pattern catalog with recommendations",
+        ),
+    ),
+    "phase4": SimpleNamespace(
+        ids=("T4.1", "T4.2"),
+        names=(
+            "Finding Synthesis",
+            "Recommendation Generation",
+        ),
+        descriptions=(
+            "Synthesize findings from all previous analyses",
+            "Generate actionable recommendations",
+        ),
+        priorities=("high", "high"),
+        dependencies=(("phase3",), ("T4.1",)),
+        expected_outputs=(
+            "Integrated findings report",
+            "Prioritized recommendation list",
+        ),
+    ),
+    "phase5": SimpleNamespace(
+        ids=("T5.1", "T5.2"),
+        names=(
+            "Report Consolidation",
+            "Documentation Generation",
+        ),
+        descriptions=(
+            "Consolidate all phase reports into final deliverable",
+            "Generate project documentation and guidelines",
+        ),
+        priorities=("high", "medium"),
+        dependencies=(("phase4",), ("T5.1",)),
+        expected_outputs=(
+            "Comprehensive final report",
+            "Complete documentation package",
+        ),
+    ),
+}
+
+# ====================================================
+# Output Templates
+# Prepared once at import; only the per-blueprint values are filled in.
+# ====================================================
+
+_PROMPT_TASK_LINE = "- [{id}] {name}: {description}"
+_PROMPT_CRITERION_LINE = "- {criterion}: {description}"
+
+_MARKDOWN_HEADER = "# {phase} Blueprint\n\nGenerated: {generated_at}\n\n"
+_MARKDOWN_TASK_SECTION = (
+    "### {id}: {name}\n"
+    "- **Description**: {description}\n"
+    "- **Priority**: {priority}\n"
+    "- **Dependencies**: {dependencies}\n"
+    "- **Expected Output**: {expected_output}\n\n"
+)
+
+
 # ====================================================
 # Blueprint Generator Class
 # ====================================================
@@ -95,108 +210,28 @@ class BlueprintGenerator:
     
     def _generate_tasks(self, phase_name: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate specific tasks based on phase and context."""
-        phase_tasks = {
-            "phase1": [
-                {
-                    "id": "T1.1",
-                    "name": "Directory Structure Analysis",
-                    "description": "Analyze and map the complete directory structure",
-                    "priority": "high",
-                    "dependencies": [],
-                    "expected_output": "Structured directory tree with annotations"
-                },
-                {
-                    "id": "T1.2",
-                    "name": "Dependency Investigation",
-                    "description": "Identify all project dependencies and their versions",
-                    "priority": "high",
-                    "dependencies": [],
-                    "expected_output": "Dependency graph with version compatibility analysis"
-                },
-                {
-                    "id": "T1.3",
-                    "name": "Technology Stack Identification",
-                    "description": "Identify all frameworks, libraries, and technologies used",
-                    "priority": "high",
-                    "dependencies": ["T1.1", "T1.2"],
-                    "expected_output": "Comprehensive tech stack documentation"
-                }
-            ],
-            "phase2": [
-                {
-                    "id": "T2.1",
-                    "name": "Analysis Plan Creation",
-                    "description": "Create detailed analysis plan based on Phase 1 findings",
-                    "priority": "high",
-                    "dependencies": ["phase1"],
-                    "expected_output": "Structured analysis plan with agent assignments"
-                },
-                {
-                    "id": "T2.2",
-                    "name": "Resource Allocation",
-                    "description": "Allocate computational and agent resources",
-                    "priority": "medium",
-                    "dependencies": ["T2.1"],
-                    "expected_output": "Resource allocation matrix"
-                }
-            ],
-            "phase3": [
-                {
-                    "id": "T3.1",
-                    "name": "Component Deep Dive",
-                    "description": "Perform deep analysis of identified components",
-                    "priority": "high",
-                    "dependencies": ["phase2"],
-                    "expected_output": "Detailed component analysis reports"
-                },
-                {
-                    "id": "T3.2",
-                    "name": "Pattern Recognition",
-                    "description": "Identify architectural patterns and anti-patterns",
-                    "priority": "medium",
-                    "dependencies": ["T3.1"],
-                    "expected_output": "Pattern catalog with recommendations"
-                }
-            ],
-            "phase4": [
-                {
-                    "id": "T4.1",
-                    "name": "Finding Synthesis",
-                    "description": "Synthesize findings from all previous analyses",
-                    "priority": "high",
-                    "dependencies": ["phase3"],
-                    "expected_output": "Integrated findings report"
-                },
-                {
-                    "id": "T4.2",
-                    "name": "Recommendation Generation",
-                    "description": "Generate actionable recommendations",
-                    "priority": "high",
-                    "dependencies": ["T4.1"],
-                    "expected_output": "Prioritized recommendation list"
-                }
-            ],
-            "phase5": [
-                {
-                    "id": "T5.1",
-                    "name": "Report Consolidation",
-                    "description": "Consolidate all phase reports into final deliverable",
-                    "priority": "high",
-                    "dependencies": ["phase4"],
-                    "expected_output": "Comprehensive final report"
-                },
-                {
-                    "id": "T5.2",
-                    "name": "Documentation Generation",
-                    "description": "Generate project documentation and guidelines",
-                    "priority": "medium",
-                    "dependencies": ["T5.1"],
-                    "expected_output": "Complete documentation package"
-                }
-            ]
-        }
+        table = _PHASE_TASKS.get(phase_name)
+        if table is None:
+            return []
         
-        return phase_tasks.get(phase_name, [])
+        return [
+            {
+                "id": task_id,
+                "name": name,
+                "description": description,
+                "priority": priority,
+                "dependencies": list(dependencies),
+                "expected_output": expected_output
+            }
+            for task_id, name, description, priority, dependencies, expected_output in zip(
+                table.ids,
+                table.names,
+                table.descriptions,
+                table.priorities,
+                table.dependencies,
+                table.expected_outputs
+            )
+        ]
     
     def _define_agents(self, phase_name: str) -> List[Dict[str, Any]]:
         """Define agent roles and configurations for the phase."""
@@ -337,23 +372,21 @@ class BlueprintGenerator:
     
     def _create_execution_plan(self, phase_name: str) -> Dict[str, Any]:
         """Create the execution plan for the phase."""
+        checkpoints = self._define_checkpoints(phase_name)
         return {
             "sequence": self._get_execution_sequence(phase_name),
             "parallelization": self._get_parallelization_strategy(phase_name),
-            "checkpoints": self._define_checkpoints(phase_name),
-            "rollback_strategy": self._define_rollback_strategy(phase_name)
+            "checkpoints": checkpoints,
+            # Copies, so the saved YAML has no anchors/aliases between the two
+            "rollback_strategy": self._define_rollback_strategy(
+                phase_name, [dict(checkpoint) for checkpoint in checkpoints]
+            )
         }
     
     def _get_execution_sequence(self, phase_name: str) -> List[str]:
         """Get the execution sequence for tasks."""
-        sequences = {
-            "phase1": ["T1.1", "T1.2", "T1.3"],
-            "phase2": ["T2.1", "T2.2"],
-            "phase3": ["T3.1", "T3.2"],
-            "phase4": ["T4.1", "T4.2"],
-            "phase5": ["T5.1", "T5.2"]
-        }
-        return sequences.get(phase_name, [])
+        table = _PHASE_TASKS.get(phase_name)
+        return list(table.ids) if table is not None else []
     
     def _get_parallelization_strategy(self, phase_name: str) -> Dict[str, Any]:
         """Define parallelization strategy."""
@@ -366,10 +399,11 @@ class BlueprintGenerator:
     
     def _define_checkpoints(self, phase_name: str) -> List[Dict[str, Any]]:
         """Define checkpoints for the phase."""
+        sequence = self._get_execution_sequence(phase_name)
         return [
             {
                 "id": f"CP_{phase_name}_1",
-                "after_task": self._get_execution_sequence(phase_name)[0] if self._get_execution_sequence(phase_name) else None,
+                "after_task": sequence[0] if sequence else None,
                 "validation": "Initial task completion check",
                 "action_on_failure": "retry_with_adjusted_parameters"
             },
@@ -381,11 +415,21 @@ class BlueprintGenerator:
             }
         ]
     
-    def _define_rollback_strategy(self, phase_name: str) -> Dict[str, Any]:
-        """Define rollback strategy for failures."""
+    def _define_rollback_strategy(
+        self,
+        phase_name: str,
+        checkpoints: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Define rollback strategy for failures.
+        
+        Args:
+            phase_name: Name of the phase
+            checkpoints: Checkpoints defined for the phase, used as rollback points
+        """
         return {
             "trigger_conditions": ["critical_failure", "validation_failure"],
-            "rollback_points": self._define_checkpoints(phase_name),
+            "rollback_points": checkpoints,
             "recovery_actions": ["restore_previous_state", "adjust_parameters", "retry_with_fallback"]
         }
     
@@ -416,7 +460,9 @@ class BlueprintGenerator:
         with open(json_path, 'w') as f:
             json.dump(blueprint, f, indent=2)
         
-        # Save as YAML for readability
+        # Save as YAML for readability (imported lazily; only needed here)
+        import yaml
+        
         yaml_path = self.output_dir / f"{phase_name}_blueprint.yaml"
         with open(yaml_path, 'w') as f:
             yaml.dump(blueprint, f, default_flow_style=False)
@@ -430,17 +476,22 @@ class BlueprintGenerator:
     def _save_as_markdown(self, blueprint: Dict[str, Any], path: Path):
         """Save blueprint as a formatted Markdown document."""
         with open(path, 'w') as f:
-            f.write(f"# {blueprint['metadata']['phase'].upper()} Blueprint\n\n")
-            f.write(f"Generated: {blueprint['metadata']['generated_at']}\n\n")
+            f.write(_MARKDOWN_HEADER.format(
+                phase=blueprint['metadata']['phase'].upper(),
+                generated_at=blueprint['metadata']['generated_at']
+            ))
             
             # Tasks section
             f.write("## Tasks\n\n")
             for task in blueprint['tasks']:
-                f.write(f"### {task['id']}: {task['name']}\n")
-                f.write(f"- **Description**: {task['description']}\n")
-                f.write(f"- **Priority**: {task['priority']}\n")
-                f.write(f"- **Dependencies**: {', '.join(task['dependencies']) if task['dependencies'] else 'None'}\n")
-                f.write(f"- **Expected Output**: {task['expected_output']}\n\n")
+                f.write(_MARKDOWN_TASK_SECTION.format(
+                    id=task['id'],
+                    name=task['name'],
+                    description=task['description'],
+                    priority=task['priority'],
+                    dependencies=', '.join(task['dependencies']) if task['dependencies'] else 'None',
+                    expected_output=task['expected_output']
+                ))
             
             # Agents section
             f.write("## Agents\n\n")
@@ -484,50 +535,67 @@ class BlueprintGenerator:
         Returns:
             Enhanced prompt with blueprint context
         """
-        blueprint_context = f"""
-# BLUEPRINT CONTEXT (Plan Mode Active)
-
-## Phase: {blueprint['metadata']['phase']}
-Generated: {blueprint['metadata']['generated_at']}
-
-## Your Tasks:
-{self._format_tasks_for_prompt(blueprint['tasks'])}
-
-## Your Role:
-{self._format_agents_for_prompt(blueprint['agents'])}
-
-## Success Criteria:
-{self._format_criteria_for_prompt(blueprint['evaluation_criteria'])}
-
-## Execution Constraints:
-- Time Limit: {blueprint['constraints']['time_limit']}
-- Quality Thresholds: Minimum {blueprint['constraints']['quality_thresholds']['min_accuracy']*100}% accuracy
-
----
-"""
-        return blueprint_context + base_prompt
+        return self.build_blueprint_context(blueprint) + base_prompt
     
-    def _format_tasks_for_prompt(self, tasks: List[Dict[str, Any]]) -> str:
-        """Format tasks for prompt injection."""
-        formatted = []
-        for task in tasks:
-            formatted.append(f"- [{task['id']}] {task['name']}: {task['description']}")
-        return "\n".join(formatted)
+    def build_blueprint_context(self, blueprint: Dict[str, Any]) -> str:
+        """
+        Render the blueprint context block that precedes a prompt template.
+        
+        The block depends only on the blueprint, so callers enhancing several
+        templates with the same blueprint can render it once and prepend it.
+        
+        Args:
+            blueprint: The blueprint to render
+            
+        Returns:
+            Blueprint context block, ending with a separator line
+        """
+        metadata = blueprint['metadata']
+        constraints = blueprint['constraints']
+        
+        # Collect every line once and join in a single pass at the end
+        lines = [
+            "",
+            "# BLUEPRINT CONTEXT (Plan Mode Active)",
+            "",
+            f"## Phase: {metadata['phase']}",
+            f"Generated: {metadata['generated_at']}",
+            "",
+            "## Your Tasks:",
+        ]
+        lines.extend(self._format_tasks_for_prompt(blueprint['tasks']) or [""])
+        lines.append("")
+        lines.append("## Your Role:")
+        lines.extend(self._format_agents_for_prompt(blueprint['agents']))
+        lines.append("")
+        lines.append("## Success Criteria:")
+        lines.extend(self._format_criteria_for_prompt(blueprint['evaluation_criteria']) or [""])
+        lines.extend([
+            "",
+            "## Execution Constraints:",
+            f"- Time Limit: {constraints['time_limit']}",
+            f"- Quality Thresholds: Minimum {constraints['quality_thresholds']['min_accuracy']*100}% accuracy",
+            "",
+            "---",
+            "",
+        ])
+        return "\n".join(lines)
     
-    def _format_agents_for_prompt(self, agents: List[Dict[str, Any]]) -> str:
-        """Format agent roles for prompt injection."""
+    def _format_tasks_for_prompt(self, tasks: List[Dict[str, Any]]) -> List[str]:
+        """Format tasks for prompt injection as a list of lines."""
+        return [_PROMPT_TASK_LINE.format_map(task) for task in tasks]
+    
+    def _format_agents_for_prompt(self, agents: List[Dict[str, Any]]) -> List[str]:
+        """Format agent roles for prompt injection as a list of lines."""
         if not agents:
-            return "No specific agent role defined."
+            return ["No specific agent role defined."]
         
         formatted = []
         for agent in agents:
             formatted.append(f"You are the {agent['name']} - {agent['role']}")
             formatted.append(f"Your capabilities: {', '.join(agent['capabilities'])}")
-        return "\n".join(formatted)
+        return formatted
     
-    def _format_criteria_for_prompt(self, criteria: Dict[str, List[Dict[str, Any]]]) -> str:
-        """Format evaluation criteria for prompt injection."""
-        formatted = []
-        for criterion in criteria['task_criteria']:
-            formatted.append(f"- {criterion['criterion']}: {criterion['description']}")
-        return "\n".join(formatted)
+    def _format_criteria_for_prompt(self, criteria: Dict[str, List[Dict[str, Any]]]) -> List[str]:
+        """Format evaluation criteria for prompt injection as a list of lines."""
+        return [_PROMPT_CRITERION_LINE.format_map(criterion) for criterion in criteria['task_criteria']]
@@ -9,15 +9,222 @@ enabling Plan Mode workflow by injecting blueprints into agent prompts.
 # Importing Required Libraries
 # ====================================================
 
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import chain
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple
 import asyncio
+import hashlib
+import json
 import logging
+import weakref
 from pathlib import Path
 
+import numpy as np
+
 from ...core.blueprint.generator import BlueprintGenerator
 from ...core.agents.base import BaseArchitect
 from ...config.prompts.phase_1_prompts import PHASE_1_BASE_PROMPT
 
+# ====================================================
+# Evaluation Scores
+# Placeholder scores per task criterion until real metrics are wired in
+# (completeness, quality metrics, execution time, accuracy validation).
+# ====================================================
+
+CRITERION_SCORES = {
+    "Completeness": 0.8,
+    "Quality": 0.85,
+    "Timeliness": 0.9,
+    "Accuracy": 0.87
+}
+DEFAULT_CRITERION_SCORE = 0.5
+
+# Characters of findings text searched per batch during task evaluation
+SCAN_CHUNK_SIZE = 64 * 1024
+
+
+# ====================================================
+# Evaluation Result
+# ====================================================
+
+@dataclass(frozen=True)
+class BlueprintEvaluation:
+    """Evaluation of phase results against a blueprint's criteria."""
+    
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ("task_completion", "criteria_scores", "overall_score", "recommendations")
+    
+    task_completion: Dict[str, Any]
+    criteria_scores: Dict[str, Dict[str, Any]]
+    overall_score: float
+    recommendations: List[str]
+    
+    def asdict(self) -> Dict[str, Any]:
+        """
+        Return the evaluation as a plain dictionary.
+        
+        Shallow: the nested dicts and lists are shared with the record rather
+        than deep-copied as dataclasses.asdict would.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# ====================================================
+# Helpers
+# ====================================================
+
+def _stable_hash(obj: Any) -> str:
+    """Hash a JSON-like object by content, independent of key order."""
+    payload = json.dumps(obj, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class _FrozenDict(dict):
+    """
+    Read-only dict used to share cached blueprints and results without copying them.
+    
+    Unlike types.MappingProxyType it is still a dict, so architects can keep
+    serializing contexts that carry the blueprint with json.dumps.
+    """
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Cached mapping is read-only; copy it with dict() to modify it")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        return (_FrozenDict, (dict(self),))
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively convert dicts to read-only dicts and lists to tuples."""
+    if isinstance(obj, _FrozenDict):
+        # Already frozen all the way down (e.g. a cached blueprint)
+        return obj
+    if isinstance(obj, dict):
+        return _FrozenDict({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+def _build_keyword_index(tasks: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Map each expected-output keyword to a bitmask of the tasks that use it.
+    
+    Bit i of a mask stands for tasks[i]. The returned dict is a fresh copy
+    the caller may consume.
+    """
+    return dict(_keyword_index(tuple(task["expected_output"] for task in tasks)))
+
+
+@lru_cache(maxsize=256)
+def _keyword_index(expected_outputs: Tuple[str, ...]) -> Dict[str, int]:
+    """
+    Split and casefold the expected outputs of a task list into a keyword index.
+    
+    Memoized on the outputs themselves, so each blueprint's keywords are
+    prepared once rather than on every evaluation.
+    """
+    index: Dict[str, int] = {}
+    for i, expected_output in enumerate(expected_outputs):
+        task_bit = 1 << i
+        for keyword in expected_output.casefold().split():
+            index[keyword] = index.get(keyword, 0) | task_bit
+    return index
+
+
+def _weighted_mean(criteria: Iterable[Dict[str, Any]]) -> float:
+    """
+    Weighted mean of criterion scores, or 0.0 if the weights sum to zero.
+    
+    Scores and weights are loaded into one (n, 2) array in a single pass over
+    the criteria, so the reduction stays in numpy however many criteria a
+    blueprint defines.
+    """
+    pairs = np.fromiter(
+        chain.from_iterable((c["score"], c["weight"]) for c in criteria),
+        dtype=np.float64
+    ).reshape(-1, 2)
+    scores, weights = pairs[:, 0], pairs[:, 1]
+    total_weight = weights.sum()
+    return float(scores @ weights / total_weight) if total_weight else 0.0
+
+
+def _iter_text_leaves(obj: Any) -> Iterator[str]:
+    """
+    Yield the text of every leaf (and mapping key) in a nested structure.
+    
+    Containers are walked with an explicit stack rather than recursion;
+    non-string leaves yield their repr, as they would in str(obj).
+    """
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        else:
+            yield repr(item)
+
+
+def _iter_text_chunks(obj: Any, chunk_size: int = SCAN_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Yield the casefolded leaf texts of a nested structure, batched into chunks.
+    
+    Leaves are joined with newlines until a chunk reaches ``chunk_size``
+    characters, so findings made of many small strings are searched with a
+    few large substring scans rather than one scan per leaf. Keywords never
+    contain whitespace, so they cannot match across the separators.
+    """
+    batch: List[str] = []
+    size = 0
+    for text in _iter_text_leaves(obj):
+        batch.append(text.casefold())
+        size += len(text) + 1
+        if size >= chunk_size:
+            yield "\n".join(batch)
+            batch = []
+            size = 0
+    if batch:
+        yield "\n".join(batch)
+
+
+async def _blueprint_enhanced_analyze(
+    integration: "BlueprintIntegration",
+    original: Callable[[Dict[str, Any]], Awaitable[Any]],
+    architect: Any,
+    blueprint: Dict[str, Any],
+    blueprint_context: str,
+    has_template: bool,
+    context: Dict[str, Any]
+) -> Any:
+    """
+    Analyze method installed on architects by BlueprintIntegration.
+    
+    Bound per architect with functools.partial; calls the original analyze
+    with blueprint context while holding a slot of the provider's pool.
+    """
+    enhanced_context = integration._build_enhanced_context(
+        architect, context, blueprint, blueprint_context, has_template
+    )
+    async with integration._get_semaphore(architect):
+        return await original(enhanced_context)
+
+
 # ====================================================
 # Blueprint Integration Class
 # ====================================================
@@ -32,17 +239,36 @@ class BlueprintIntegration:
     3. Post-phase evaluation against blueprint criteria
     """
     
-    def __init__(self, blueprint_dir: str = "phases_output"):
-        """Initialize the blueprint integration."""
+    def __init__(
+        self,
+        blueprint_dir: str = "phases_output",
+        max_parallel: int = 8,
+        cache_size: int = 256
+    ):
+        """
+        Initialize the blueprint integration.
+        
+        Args:
+            blueprint_dir: Directory where blueprints will be stored
+            max_parallel: Maximum concurrent architect calls per model provider
+            cache_size: Maximum number of blueprints, and of phase results, kept for reuse
+        """
         self.generator = BlueprintGenerator(blueprint_dir)
         self.logger = logging.getLogger(__name__)
+        self.max_parallel = max_parallel
+        self.cache_size = cache_size
+        self._blueprint_cache: "OrderedDict[Tuple[str, str, str], Dict[str, Any]]" = OrderedDict()
+        self._result_cache: "OrderedDict[Tuple[str, str, str, int], Tuple[Any, Dict[str, Any]]]" = OrderedDict()
+        # Semaphores are bound to an event loop, so keep one pool set per loop
+        self._semaphores = weakref.WeakKeyDictionary()
     
     async def execute_phase_with_blueprint(
         self,
         phase_name: str,
         phase_executor: Any,  # The phase analysis class (e.g., Phase1Analysis)
         project_context: Dict[str, Any],
-        custom_requirements: Optional[Dict[str, Any]] = None
+        custom_requirements: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Execute a phase with blueprint-driven Plan Mode.
@@ -52,17 +278,37 @@ class BlueprintIntegration:
             phase_executor: The phase analysis instance
             project_context: Context information about the project
             custom_requirements: Optional custom requirements
+            use_cache: Reuse (and store) the results of an earlier run of the same
+                executor with the same phase, context and requirements. Off by
+                default, since results also depend on state outside the context
+                (file contents, model output). The cache keeps a deep read-only
+                copy, which is what cache hits return
             
         Returns:
             Enhanced phase results including blueprint evaluation
         """
-        # Step 1: Generate blueprint
-        self.logger.info(f"Generating blueprint for {phase_name}")
-        blueprint = self.generator.generate_blueprint(
-            phase_name,
-            project_context,
-            custom_requirements
-        )
+        cache_key = None
+        if use_cache:
+            input_key = self._cache_key(phase_name, project_context, custom_requirements)
+            if input_key is not None:
+                # Entries hold a reference to their executor, so its id cannot
+                # be reused by another executor while the entry is cached
+                cache_key = (*input_key, id(phase_executor))
+        
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                self.logger.info(f"Reusing cached results for {phase_name}")
+                return cached[1]
+        
+        # Step 1: Generate blueprint, overlapping with any executor warmup
+        blueprint_request = self._get_blueprint(phase_name, project_context, custom_requirements)
+        warmup = getattr(phase_executor, "warmup", None)
+        if warmup is not None:
+            blueprint, _ = await asyncio.gather(blueprint_request, warmup())
+        else:
+            blueprint = await blueprint_request
         
         # Step 2: Enhance phase architects with blueprint context
         self._enhance_architects_with_blueprint(phase_executor, blueprint)
@@ -84,13 +330,95 @@ class BlueprintIntegration:
         evaluation = self._evaluate_against_blueprint(phase_results, blueprint)
         
         # Step 5: Return enhanced results
-        return {
+        enhanced_results = {
             "phase": phase_name,
             "blueprint": blueprint,
             "results": phase_results,
-            "evaluation": evaluation,
+            # Plain dict at the public boundary so results stay JSON-serializable
+            "evaluation": evaluation.asdict(),
             "plan_mode": True
         }
+        
+        if cache_key is not None:
+            self._cache_put(
+                self._result_cache, cache_key, (phase_executor, _freeze(enhanced_results))
+            )
+        
+        return enhanced_results
+    
+    def invalidate(self, phase_name: Optional[str] = None):
+        """
+        Drop cached phase results so the next execution runs the phase again.
+        
+        Args:
+            phase_name: Only drop results for this phase; all phases if omitted
+        """
+        if phase_name is None:
+            self._result_cache.clear()
+            return
+        
+        for key in [key for key in self._result_cache if key[0] == phase_name]:
+            del self._result_cache[key]
+    
+    def _cache_key(
+        self,
+        phase_name: str,
+        project_context: Dict[str, Any],
+        custom_requirements: Optional[Dict[str, Any]]
+    ) -> Optional[Tuple[str, str, str]]:
+        """
+        Build the cache key for a phase from content hashes of its inputs.
+        
+        Returns None if the inputs cannot be serialized to JSON (e.g. dicts
+        with tuple or mixed-type keys); such calls are simply not cached.
+        """
+        try:
+            return (phase_name, _stable_hash(project_context), _stable_hash(custom_requirements))
+        except (TypeError, ValueError):
+            return None
+    
+    def _cache_put(self, cache: "OrderedDict[Any, Any]", key: Any, value: Any):
+        """Store a value in an LRU cache, evicting the oldest entries beyond cache_size."""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+    
+    async def _get_blueprint(
+        self,
+        phase_name: str,
+        project_context: Dict[str, Any],
+        custom_requirements: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Get the blueprint for a phase, generating it only for unseen inputs.
+        
+        Blueprints are a pure function of their inputs, so they are memoized by
+        phase name and content hashes of the context and requirements. The
+        returned blueprint is read-only, so it is shared rather than copied.
+        Generation (which also writes the blueprint files) runs in a worker
+        thread so it does not block the event loop.
+        """
+        key = self._cache_key(phase_name, project_context, custom_requirements)
+        
+        blueprint = self._blueprint_cache.get(key) if key is not None else None
+        if blueprint is not None:
+            self._blueprint_cache.move_to_end(key)
+            self.logger.info(f"Reusing cached blueprint for {phase_name}")
+            return blueprint
+        
+        self.logger.info(f"Generating blueprint for {phase_name}")
+        blueprint = _freeze(await asyncio.to_thread(
+            self.generator.generate_blueprint,
+            phase_name,
+            project_context,
+            custom_requirements
+        ))
+        
+        if key is not None:
+            self._cache_put(self._blueprint_cache, key, blueprint)
+        
+        return blueprint
     
     def _enhance_architects_with_blueprint(
         self,
@@ -100,47 +428,100 @@ class BlueprintIntegration:
         """
         Enhance phase architects with blueprint context.
         
-        This modifies the architects' prompts to include blueprint specifications.
+        Each architect's analyze method is replaced by a wrapper so every call
+        receives the blueprint and a blueprint-enhanced prompt template through
+        its context; the unwrapped method is kept on
+        _blueprint_original_analyze. The prompt template and other architect
+        state are left untouched, so the wrapper can be awaited concurrently
+        (e.g. from asyncio.gather).
         """
-        if hasattr(phase_executor, 'architects'):
-            for architect in phase_executor.architects:
-                # Store original analyze method
+        architects = getattr(phase_executor, 'architects', None)
+        if not architects:
+            return
+        
+        # Render the blueprint block once and share it across architects
+        blueprint_context = self.generator.build_blueprint_context(blueprint)
+        
+        for architect in architects:
+            # Store original analyze method; if an earlier execution already
+            # enhanced it, start from the stored original instead of
+            # stacking another wrapper on top
+            if getattr(architect.analyze, "_blueprint_enhanced", False):
+                original_analyze = architect._blueprint_original_analyze
+            else:
                 original_analyze = architect.analyze
-                
-                # Create blueprint-enhanced analyze method
-                async def enhanced_analyze(context, architect=architect, original=original_analyze):
-                    # Inject blueprint into the context
-                    enhanced_context = {
-                        **context,
-                        "blueprint": blueprint,
-                        "plan_mode": True
-                    }
-                    
-                    # If the architect has a prompt template, enhance it
-                    if hasattr(architect, 'prompt_template'):
-                        original_template = architect.prompt_template
-                        architect.prompt_template = self.generator.inject_into_prompt(
-                            original_template,
-                            blueprint
-                        )
-                    
-                    # Execute with enhanced context
-                    result = await original(enhanced_context)
-                    
-                    # Restore original template if it was modified
-                    if hasattr(architect, 'prompt_template'):
-                        architect.prompt_template = original_template
-                    
-                    return result
-                
-                # Replace analyze method with enhanced version
-                architect.analyze = enhanced_analyze
+                architect._blueprint_original_analyze = original_analyze
+            
+            # Bind a blueprint-enhanced analyze method
+            enhanced_analyze = partial(
+                _blueprint_enhanced_analyze,
+                self,
+                original_analyze,
+                architect,
+                blueprint,
+                blueprint_context,
+                # Probe the capability once here, not on every call
+                hasattr(architect, 'prompt_template')
+            )
+            enhanced_analyze._blueprint_enhanced = True
+            
+            # Replace analyze method with enhanced version
+            architect.analyze = enhanced_analyze
+    
+    def _get_semaphore(self, architect: Any) -> asyncio.Semaphore:
+        """
+        Get the semaphore limiting concurrent calls to an architect's provider.
+        
+        Each model provider gets its own pool so that, for example, Anthropic
+        and OpenAI calls do not wait on each other's rate limits.
+        """
+        loop = asyncio.get_running_loop()
+        pools = self._semaphores.get(loop)
+        if pools is None:
+            pools = self._semaphores[loop] = {}
+        
+        provider = getattr(architect, "provider", None)
+        semaphore = pools.get(provider)
+        if semaphore is None:
+            semaphore = pools[provider] = asyncio.Semaphore(self.max_parallel)
+        return semaphore
+    
+    def _build_enhanced_context(
+        self,
+        architect: Any,
+        context: Dict[str, Any],
+        blueprint: Dict[str, Any],
+        blueprint_context: str,
+        has_template: bool
+    ) -> Dict[str, Any]:
+        """
+        Build the per-call context carrying the blueprint and enhanced template.
+        
+        Args:
+            architect: The architect being called
+            context: The context passed to the call
+            blueprint: The blueprint specification
+            blueprint_context: The blueprint block rendered by the generator
+            has_template: Whether the architect has a prompt_template to enhance
+        """
+        enhanced_context = {
+            **context,
+            "blueprint": blueprint,
+            "plan_mode": True
+        }
+        
+        # If the architect has a prompt template, pass the enhanced one along
+        # with this call instead of swapping the architect's attribute
+        if has_template:
+            enhanced_context["prompt_template"] = blueprint_context + architect.prompt_template
+        
+        return enhanced_context
     
     def _evaluate_against_blueprint(
         self,
         phase_results: Dict[str, Any],
         blueprint: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> BlueprintEvaluation:
         """
         Evaluate phase results against blueprint criteria.
         
@@ -151,30 +532,30 @@ class BlueprintIntegration:
         Returns:
             Evaluation results including scores and recommendations
         """
-        evaluation = {
-            "task_completion": self._evaluate_task_completion(phase_results, blueprint),
-            "criteria_scores": self._calculate_criteria_scores(phase_results, blueprint),
-            "overall_score": 0.0,
-            "recommendations": []
-        }
+        task_completion = self._evaluate_task_completion(phase_results, blueprint)
+        criteria_scores = self._calculate_criteria_scores(phase_results, blueprint)
         
         # Calculate overall score
-        task_score = evaluation["task_completion"]["completion_rate"]
-        criteria_scores = evaluation["criteria_scores"]
+        task_score = task_completion["completion_rate"]
         
         # Weighted average of all scores
-        total_weight = sum(c["weight"] for c in criteria_scores.values())
-        weighted_sum = sum(c["score"] * c["weight"] for c in criteria_scores.values())
+        weighted_score = _weighted_mean(criteria_scores.values())
         
-        evaluation["overall_score"] = (task_score * 0.5) + (weighted_sum / total_weight * 0.5)
+        overall_score = (task_score * 0.5) + (weighted_score * 0.5)
         
         # Generate recommendations based on evaluation
-        if evaluation["overall_score"] < 0.7:
-            evaluation["recommendations"].append(
+        recommendations = []
+        if overall_score < 0.7:
+            recommendations.append(
                 "Phase performance below threshold. Consider re-execution with adjusted parameters."
             )
         
-        return evaluation
+        return BlueprintEvaluation(
+            task_completion=task_completion,
+            criteria_scores=criteria_scores,
+            overall_score=overall_score,
+            recommendations=recommendations
+        )
     
     def _evaluate_task_completion(
         self,
@@ -183,25 +564,38 @@ class BlueprintIntegration:
     ) -> Dict[str, Any]:
         """Evaluate task completion against blueprint tasks."""
         expected_tasks = blueprint["tasks"]
-        completed_tasks = []
+        # Bit i is set once task i is matched
+        completed_mask = 0
         
         # Simple heuristic: check if expected outputs are mentioned in results
         if "findings" in phase_results:
-            findings_str = str(phase_results["findings"]).lower()
-            
-            for task in expected_tasks:
-                # Check if task output keywords appear in findings
-                output_keywords = task["expected_output"].lower().split()
-                if any(keyword in findings_str for keyword in output_keywords):
-                    completed_tasks.append(task["id"])
+            # Walk the findings in bounded text chunks instead of rendering the
+            # whole structure to one string; each keyword is dropped once found,
+            # and the walk stops as soon as every task is matched
+            pending = _build_keyword_index(expected_tasks)
+            for text in _iter_text_chunks(phase_results["findings"]):
+                if not pending:
+                    break
+                found = [keyword for keyword in pending if keyword in text]
+                if found:
+                    for keyword in found:
+                        completed_mask |= pending.pop(keyword)
+                    pending = {
+                        keyword: task_mask
+                        for keyword, task_mask in pending.items()
+                        if task_mask & ~completed_mask
+                    }
         
-        completion_rate = len(completed_tasks) / len(expected_tasks) if expected_tasks else 0
+        completed_count = bin(completed_mask).count("1")
+        completion_rate = completed_count / len(expected_tasks) if expected_tasks else 0
         
         return {
             "expected_tasks": len(expected_tasks),
-            "completed_tasks": len(completed_tasks),
+            "completed_tasks": completed_count,
             "completion_rate": completion_rate,
-            "completed_task_ids": completed_tasks
+            "completed_task_ids": [
+                task["id"] for i, task in enumerate(expected_tasks) if completed_mask >> i & 1
+            ]
         }
     
     def _calculate_criteria_scores(
@@ -211,28 +605,16 @@ class BlueprintIntegration:
     ) -> Dict[str, Dict[str, Any]]:
         """Calculate scores for each evaluation criterion."""
         criteria = blueprint["evaluation_criteria"]["task_criteria"]
-        scores = {}
-        
-        for criterion in criteria:
-            # Simplified scoring logic - in production, this would be more sophisticated
-            if criterion["criterion"] == "Completeness":
-                score = 0.8  # Placeholder - would analyze actual completeness
-            elif criterion["criterion"] == "Quality":
-                score = 0.85  # Placeholder - would assess quality metrics
-            elif criterion["criterion"] == "Timeliness":
-                score = 0.9  # Placeholder - would check execution time
-            elif criterion["criterion"] == "Accuracy":
-                score = 0.87  # Placeholder - would validate accuracy
-            else:
-                score = 0.5
-            
-            scores[criterion["criterion"]] = {
-                "score": score,
+        
+        # Simplified scoring logic - in production, this would be more sophisticated
+        return {
+            criterion["criterion"]: {
+                "score": CRITERION_SCORES.get(criterion["criterion"], DEFAULT_CRITERION_SCORE),
                 "weight": criterion["weight"],
                 "description": criterion["description"]
             }
-        
-        return scores
+            for criterion in criteria
+        }
 
 
 # ====================================================
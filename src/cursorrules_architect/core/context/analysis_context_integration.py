@@ -6,7 +6,8 @@ existing analysis pipeline with attractor formation, field resonance, and
 emergent pattern detection.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
 
 from .context_field_engine import (
@@ -26,6 +27,35 @@ class AnalysisContextIntegration:
     - Meta-recursive improvement of analysis quality
     """
 
+    # Indicator words checked in order when typing a phase concept
+    CONCEPT_TYPE_INDICATORS = (
+        (("pattern", "structure"), AttractorType.PATTERN),
+        (("insight", "finding"), AttractorType.INSIGHT),
+        (("relation", "connection"), AttractorType.RELATIONSHIP),
+    )
+
+    # Core analysis concepts seeded into every field
+    ANALYSIS_CONCEPTS = (
+        ("discovery", AttractorType.CONCEPT, (20, 20, 20)),
+        ("understanding", AttractorType.CONCEPT, (40, 20, 20)),
+        ("synthesis", AttractorType.CONCEPT, (60, 20, 20)),
+        ("insight", AttractorType.INSIGHT, (80, 20, 20)),
+        ("quality", AttractorType.PATTERN, (20, 80, 20)),
+        ("structure", AttractorType.PATTERN, (40, 80, 20)),
+        ("relationships", AttractorType.RELATIONSHIP, (60, 80, 20)),
+        ("evolution", AttractorType.PATTERN, (80, 80, 20))
+    )
+
+    # Phase data fields whose tuple values are read in full for concepts
+    CONCEPT_LIST_FIELDS = frozenset({
+        "technologies", "frameworks", "patterns", "issues", "recommendations"
+    })
+
+    # Snapshot metrics compared when analyzing field evolution
+    EVOLUTION_METRICS = (
+        "attractor_count", "resonance_count", "pattern_count", "field_coherence", "field_energy"
+    )
+
     def __init__(self, field_storage_path: str = "analysis_context_field.json"):
         """Initialize with context field engine."""
         self.field_engine = ContextFieldEngine()
@@ -108,12 +138,16 @@ class AnalysisContextIntegration:
         if not self.current_analysis_session:
             raise ValueError("No active field analysis session")
 
+        # Extract key concepts once; attractors and protocols both use them
+        concepts = self._extract_phase_concepts(phase_data)
+
         # Create phase-specific attractors
-        phase_attractors = self._create_phase_attractors(phase_name, phase_data, phase_number)
+        phase_attractors = self._create_phase_attractors(phase_name, concepts, phase_number)
         self.phase_attractors[phase_name] = phase_attractors
 
         # Execute relevant protocols for this phase
-        protocols_executed = self._execute_phase_protocols(phase_name, phase_data, phase_number)
+        protocols_executed = self._execute_phase_protocols(phase_name, phase_data, concepts,
+                                                           phase_number)
 
         # Detect emergent patterns specific to this phase
         emergent_patterns = self.field_engine.detect_emergence()
@@ -161,15 +195,14 @@ class AnalysisContextIntegration:
         """
         # Detect patterns that span multiple phases
         all_patterns = self.field_engine.emergent_patterns
+        attractor_phases = self._index_attractor_phases()
         cross_phase_patterns = []
 
         for pattern in all_patterns.values():
             # Check if pattern involves attractors from multiple phases
             involved_phases = set()
             for element_id in pattern.elements:
-                for phase_name, phase_attractors in self.phase_attractors.items():
-                    if element_id in phase_attractors:
-                        involved_phases.add(phase_name)
+                involved_phases.update(attractor_phases.get(element_id, ()))
             
             if len(involved_phases) > 1:
                 cross_phase_patterns.append({
@@ -249,7 +282,10 @@ class AnalysisContextIntegration:
                 "concept_evolution": self._trace_concept_evolution(),
                 "insight_formation": self._trace_insight_formation()
             },
-            "analysis_recommendations": self._generate_interpretability_recommendations()
+            # Reuse the engine's column-wise count of active residues
+            "analysis_recommendations": self._generate_interpretability_recommendations(
+                base_map["symbolic_landscape"]["active_symbols"]
+            )
         }
 
         return analysis_map
@@ -307,25 +343,27 @@ class AnalysisContextIntegration:
         if not self.current_analysis_session:
             return {"status": "no_active_session"}
 
-        # Perform final field analysis
+        # Perform final field analysis; one snapshot feeds the summary,
+        # the insights and the evolution metrics
         final_patterns = self.get_cross_phase_patterns()
-        final_coherence = self.field_engine.get_field_coherence()
-        final_energy = self.field_engine.get_field_energy()
+        final_snapshot = self._capture_field_snapshot()
+        final_coherence = final_snapshot["field_coherence"]
+        final_energy = final_snapshot["field_energy"]
 
         # Generate summary insights
-        summary_insights = self._generate_session_summary()
+        summary_insights = self._generate_session_summary(final_coherence, final_energy)
 
         session_summary = {
             "session_id": self.current_analysis_session["session_id"],
             "duration": (datetime.now() - self.current_analysis_session["start_time"]).total_seconds(),
             "phases_enhanced": len(self.phase_attractors),
             "total_attractors_created": sum(len(attrs) for attrs in self.phase_attractors.values()),
-            "emergent_patterns_detected": len(self.field_engine.emergent_patterns),
+            "emergent_patterns_detected": final_snapshot["pattern_count"],
             "final_field_coherence": final_coherence,
             "final_field_energy": final_energy,
             "cross_phase_patterns": final_patterns,
             "summary_insights": summary_insights,
-            "field_evolution_metrics": self._calculate_field_evolution_metrics()
+            "field_evolution_metrics": self._calculate_field_evolution_metrics(final_snapshot)
         }
 
         # Reset session
@@ -339,19 +377,7 @@ class AnalysisContextIntegration:
 
     def _initialize_analysis_field(self):
         """Initialize field with analysis-specific attractors."""
-        # Core analysis concepts
-        analysis_concepts = [
-            ("discovery", AttractorType.CONCEPT, (20, 20, 20)),
-            ("understanding", AttractorType.CONCEPT, (40, 20, 20)),
-            ("synthesis", AttractorType.CONCEPT, (60, 20, 20)),
-            ("insight", AttractorType.INSIGHT, (80, 20, 20)),
-            ("quality", AttractorType.PATTERN, (20, 80, 20)),
-            ("structure", AttractorType.PATTERN, (40, 80, 20)),
-            ("relationships", AttractorType.RELATIONSHIP, (60, 80, 20)),
-            ("evolution", AttractorType.PATTERN, (80, 80, 20))
-        ]
-
-        for concept, attr_type, position in analysis_concepts:
+        for concept, attr_type, position in self.ANALYSIS_CONCEPTS:
             self.field_engine.create_attractor(concept, attr_type, position, strength=0.6)
 
     def _capture_field_snapshot(self) -> Dict[str, Any]:
@@ -365,7 +391,7 @@ class AnalysisContextIntegration:
             "field_energy": self.field_engine.get_field_energy()
         }
 
-    def _create_phase_attractors(self, phase_name: str, phase_data: Dict[str, Any], 
+    def _create_phase_attractors(self, phase_name: str, concepts: List[str], 
                                phase_number: int) -> List[str]:
         """Create attractors specific to an analysis phase."""
         created_attractors = []
@@ -375,21 +401,11 @@ class AnalysisContextIntegration:
         base_y = 40
         base_z = 30 + phase_number * 10
 
-        # Extract key concepts from phase data
-        concepts = self._extract_phase_concepts(phase_data)
-        
         for i, concept in enumerate(concepts[:5]):  # Limit to 5 per phase
             position = (base_x + i*5, base_y + i*3, base_z)
             
             # Determine attractor type based on concept nature
-            if "pattern" in concept.lower() or "structure" in concept.lower():
-                attr_type = AttractorType.PATTERN
-            elif "insight" in concept.lower() or "finding" in concept.lower():
-                attr_type = AttractorType.INSIGHT
-            elif "relation" in concept.lower() or "connection" in concept.lower():
-                attr_type = AttractorType.RELATIONSHIP
-            else:
-                attr_type = AttractorType.CONCEPT
+            attr_type = self._classify_concept(concept)
 
             attractor_id = self.field_engine.create_attractor(
                 f"{phase_name}_{concept}",
@@ -401,31 +417,44 @@ class AnalysisContextIntegration:
 
         return created_attractors
 
+    def _classify_concept(self, concept: str) -> AttractorType:
+        """Map a concept to an attractor type by its first matching indicator."""
+        # Concepts arrive already lowercased from _extract_phase_concepts
+        for indicators, attr_type in self.CONCEPT_TYPE_INDICATORS:
+            if any(indicator in concept for indicator in indicators):
+                return attr_type
+        return AttractorType.CONCEPT
+
     def _extract_phase_concepts(self, phase_data: Dict[str, Any]) -> List[str]:
         """Extract key concepts from phase data."""
-        concepts = []
-        
-        # Extract from different data fields
-        for key, value in phase_data.items():
-            if isinstance(value, list):
-                concepts.extend([str(item)[:20] for item in value[:3]])  # First 3 items, truncated
-            elif isinstance(value, str) and len(value) < 50:
-                concepts.append(value)
-            elif key in ["technologies", "frameworks", "patterns", "issues", "recommendations"]:
-                if isinstance(value, (list, tuple)):
-                    concepts.extend([str(item)[:15] for item in value])
-
-        # Clean and deduplicate concepts
+        # Clean and deduplicate concepts as they stream in, stopping at the top 8
         cleaned_concepts = []
-        for concept in concepts:
+        seen_concepts = set()
+        for concept in self._iter_phase_concepts(phase_data):
             clean_concept = concept.replace(" ", "_").replace("-", "_").lower()
-            if clean_concept not in cleaned_concepts and len(clean_concept) > 2:
+            if clean_concept not in seen_concepts and len(clean_concept) > 2:
+                seen_concepts.add(clean_concept)
                 cleaned_concepts.append(clean_concept)
+                if len(cleaned_concepts) == 8:
+                    break
 
-        return cleaned_concepts[:8]  # Return top 8 concepts
+        return cleaned_concepts
 
-    def _execute_phase_protocols(self, phase_name: str, phase_data: Dict[str, Any], 
-                                phase_number: int) -> List[str]:
+    def _iter_phase_concepts(self, phase_data: Dict[str, Any]) -> Iterator[str]:
+        """Yield raw concept strings from the phase data fields in order."""
+        for key, value in phase_data.items():
+            if isinstance(value, list):
+                for item in value[:3]:  # First 3 items, truncated
+                    yield str(item)[:20]
+            elif isinstance(value, str) and len(value) < 50:
+                yield value
+            elif key in self.CONCEPT_LIST_FIELDS:
+                if isinstance(value, (list, tuple)):
+                    for item in value:
+                        yield str(item)[:15]
+
+    def _execute_phase_protocols(self, phase_name: str, phase_data: Dict[str, Any],
+                                concepts: List[str], phase_number: int) -> List[str]:
         """Execute relevant protocols for a phase."""
         executed_protocols = []
 
@@ -433,7 +462,7 @@ class AnalysisContextIntegration:
         if phase_number == 1:
             protocol_id = self.field_engine.execute_protocol(
                 "attractor_co_emerge",
-                {"concepts": self._extract_phase_concepts(phase_data)[:3]}
+                {"concepts": concepts[:3]}
             )
             executed_protocols.append(protocol_id)
 
@@ -488,8 +517,7 @@ class AnalysisContextIntegration:
 
         # Insight from pattern emergence
         if patterns:
-            pattern_types = [p.pattern_type for p in patterns]
-            most_common_type = max(set(pattern_types), key=pattern_types.count)
+            most_common_type = Counter(p.pattern_type for p in patterns).most_common(1)[0][0]
             insights.append(f"Phase {phase_name} shows strong {most_common_type} emergence")
 
         # Insight from field coherence
@@ -513,46 +541,51 @@ class AnalysisContextIntegration:
         """Create symbolic residues for phase findings."""
         residues_created = []
 
-        # Create residues for important findings
+        # Create residues for important findings, one batch per context
         if "key_findings" in phase_data:
-            findings = phase_data["key_findings"]
-            for i, finding in enumerate(findings[:3]):  # Top 3 findings
-                residue_id = self.field_engine.add_symbolic_residue(
-                    symbol=f"F{i+1}",
-                    meaning=str(finding)[:50],  # Truncate long findings
-                    context=f"{phase_name}_finding",
-                    position=(70 + i*5, 60, 40),
-                    decay_rate=0.005  # Slow decay for important findings
-                )
-                residues_created.append(residue_id)
+            findings = phase_data["key_findings"][:3]  # Top 3 findings
+            residues_created.extend(self.field_engine.add_symbolic_residues(
+                symbols=[f"F{i+1}" for i in range(len(findings))],
+                meanings=[str(finding)[:50] for finding in findings],  # Truncate long findings
+                context=f"{phase_name}_finding",
+                positions=[(70 + i*5, 60, 40) for i in range(len(findings))],
+                decay_rate=0.005  # Slow decay for important findings
+            ))
 
         # Create residues for technologies
         if "technologies" in phase_data:
-            for i, tech in enumerate(phase_data["technologies"][:2]):
-                residue_id = self.field_engine.add_symbolic_residue(
-                    symbol=f"T{tech[0].upper()}",
-                    meaning=f"technology_{tech}",
-                    context=f"{phase_name}_technology",
-                    position=(30 + i*10, 70, 50),
-                    decay_rate=0.01
-                )
-                residues_created.append(residue_id)
+            technologies = phase_data["technologies"][:2]
+            residues_created.extend(self.field_engine.add_symbolic_residues(
+                symbols=[f"T{tech[0].upper()}" for tech in technologies],
+                meanings=[f"technology_{tech}" for tech in technologies],
+                context=f"{phase_name}_technology",
+                positions=[(30 + i*10, 70, 50) for i in range(len(technologies))],
+                decay_rate=0.01
+            ))
 
         return residues_created
 
+    def _index_attractor_phases(self) -> Dict[str, List[str]]:
+        """Map each phase attractor ID to the phases that created it."""
+        # Built once per analysis so lookups avoid scanning every phase
+        attractor_phases: Dict[str, List[str]] = {}
+        for phase_name, phase_attractors in self.phase_attractors.items():
+            for attractor_id in phase_attractors:
+                attractor_phases.setdefault(attractor_id, []).append(phase_name)
+        return attractor_phases
+
     def _analyze_cross_phase_resonance(self) -> Dict[str, Any]:
         """Analyze resonance patterns across phases."""
         # Get all resonances
         all_resonances = self.field_engine.resonance_patterns
+        attractor_phases = self._index_attractor_phases()
 
         cross_phase_resonances = []
         for resonance in all_resonances.values():
             # Check if resonance involves attractors from multiple phases
             involved_phases = set()
             for source_id in resonance.source_ids:
-                for phase_name, phase_attractors in self.phase_attractors.items():
-                    if source_id in phase_attractors:
-                        involved_phases.add(phase_name)
+                involved_phases.update(attractor_phases.get(source_id, ()))
             
             if len(involved_phases) > 1:
                 cross_phase_resonances.append({
@@ -605,7 +638,7 @@ class AnalysisContextIntegration:
         current_snapshot = self._capture_field_snapshot()
 
         evolution_metrics = {}
-        for key in ["attractor_count", "resonance_count", "pattern_count", "field_coherence", "field_energy"]:
+        for key in self.EVOLUTION_METRICS:
             initial_value = initial_snapshot.get(key, 0)
             current_value = current_snapshot.get(key, 0)
             if initial_value > 0:
@@ -707,8 +740,9 @@ class AnalysisContextIntegration:
             }
             
             # Find patterns influenced by this phase
+            phase_attractor_set = set(phase_attractors)
             for pattern in self.field_engine.emergent_patterns.values():
-                if any(attr_id in pattern.elements for attr_id in phase_attractors):
+                if not phase_attractor_set.isdisjoint(pattern.elements):
                     attributions[phase_name]["influenced_patterns"].append(pattern.id)
 
         return attributions
@@ -746,7 +780,7 @@ class AnalysisContextIntegration:
 
         return insight_traces
 
-    def _generate_interpretability_recommendations(self) -> List[str]:
+    def _generate_interpretability_recommendations(self, active_symbols: int) -> List[str]:
         """Generate recommendations for better interpretability."""
         recommendations = []
         
@@ -759,20 +793,17 @@ class AnalysisContextIntegration:
             recommendations.append("Consider field simplification for better interpretability")
         
         # Check pattern clarity
-        unclear_patterns = [p for p in self.field_engine.emergent_patterns.values() 
-                           if p.stability < 0.3]
-        if len(unclear_patterns) > 3:
+        unclear_patterns = sum(p.stability < 0.3 for p in self.field_engine.emergent_patterns.values())
+        if unclear_patterns > 3:
             recommendations.append("Stabilize unclear patterns for better understanding")
 
         # Check symbolic residue clarity
-        active_residues = [r for r in self.field_engine.symbolic_residues.values() 
-                          if r.strength > 0.1]
-        if len(active_residues) > 20:
+        if active_symbols > 20:
             recommendations.append("Consolidate symbolic residues for clarity")
 
         return recommendations
 
-    def _generate_session_summary(self) -> List[str]:
+    def _generate_session_summary(self, final_coherence: float, final_energy: float) -> List[str]:
         """Generate high-level summary insights for the session."""
         insights = []
         
@@ -786,24 +817,21 @@ class AnalysisContextIntegration:
             insights.append(f"Strong pattern emergence with {pattern_count} distinct patterns identified")
         
         # Coherence insights
-        final_coherence = self.field_engine.get_field_coherence()
         if final_coherence > 0.8:
             insights.append("Achieved high conceptual coherence throughout analysis")
         
         # Energy insights
-        final_energy = self.field_engine.get_field_energy()
         if final_energy > 12:
             insights.append("Rich conceptual development with high field energy")
 
         return insights
 
-    def _calculate_field_evolution_metrics(self) -> Dict[str, float]:
-        """Calculate metrics for field evolution during the session."""
+    def _calculate_field_evolution_metrics(self, current_snapshot: Dict[str, Any]) -> Dict[str, float]:
+        """Calculate metrics for field evolution against the given current snapshot."""
         if not self.current_analysis_session:
             return {}
 
         initial_snapshot = self.current_analysis_session.get("field_snapshot", {})
-        current_snapshot = self._capture_field_snapshot()
 
         metrics = {}
         
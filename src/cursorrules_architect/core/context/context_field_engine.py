@@ -6,12 +6,17 @@ from the PROMPTS directory, including attractor dynamics, field resonance,
 and emergent pattern detection.
 """
 
+import itertools
 import json
-import uuid
+import random
+import sys
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple, Set
-from dataclasses import dataclass, asdict, field
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Any, Tuple, Set
+from dataclasses import dataclass, asdict, field, fields, MISSING
 from enum import Enum
+from operator import attrgetter
 import math
 import numpy as np
 
@@ -44,12 +49,322 @@ class ProtocolState(Enum):
     CONVERGED = "converged"
 
 
+# Positions are only queried by distance, so single precision is plenty and
+# halves the bytes each vectorized query streams through the cache
+_POSITION_DTYPE = np.float32
+
+# Execution IDs only key dicts, so a process-wide counter plus a random
+# suffix is unique enough and far cheaper than uuid4's OS entropy read
+_EXECUTION_COUNTER = itertools.count()
+
+
+def _next_execution_id() -> str:
+    """Return a new protocol execution ID."""
+    return f"exec_{next(_EXECUTION_COUNTER)}_{random.getrandbits(32):08x}"
+
+
+# Row codes for attractor types in the structure-of-arrays store
+_ATTRACTOR_TYPE_CODES = {attractor_type: code for code, attractor_type in enumerate(AttractorType)}
+_ATTRACTOR_TYPE_NAMES = tuple(attractor_type.value for attractor_type in AttractorType)
+
+# Lifecycle stages that advance with age: stage -> (next stage, minimum age in seconds)
+_AGED_LIFECYCLE_STAGES = {
+    "forming": ("stabilizing", 1 * 3600.0),
+    "stabilizing": ("mature", 6 * 3600.0)
+}
+
+
+class _Column:
+    """
+    Dataclass field descriptor backed by an _ElementStore column.
+    
+    Until the owning element is bound to a store its value lives on the
+    instance; afterwards reads and writes go straight to the store row, so
+    the dataclass stays the public API while the store holds the data.
+    """
+
+    def __init__(self, default: Any = MISSING):
+        self.default = default
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.local_name = "_" + name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            # Expose only the plain default (or none at all) to dataclasses
+            if self.default is MISSING:
+                raise AttributeError(self.name)
+            return self.default
+        store = obj._store
+        if store is None:
+            return getattr(obj, self.local_name)
+        return store.columns[self.name][obj._row].item()
+
+    def __set__(self, obj, value):
+        store = obj._store
+        if store is None:
+            setattr(obj, self.local_name, value)
+        else:
+            store.set(self.name, obj._row, value)
+
+
+class _ElementStore:
+    """
+    Growable structure-of-arrays store mirroring a family of field elements.
+    
+    Each column is a NumPy array indexed by row, ``rows`` maps element IDs to
+    rows and ``elements`` maps rows back to the dataclass instances. Capacity
+    doubles on overflow so appends stay amortized O(1). Columns named in
+    ``totals`` keep a running sum so aggregates never need a full pass.
+    """
+
+    def __init__(self, columns: Dict[str, Tuple[Any, Tuple[int, ...]]], capacity: int = 16,
+                 totals: Iterable[str] = ()):
+        self.columns = {
+            name: np.zeros((capacity,) + shape, dtype=dtype)
+            for name, (dtype, shape) in columns.items()
+        }
+        self.rows: Dict[str, int] = {}
+        self.elements: List[Any] = []
+        self.totals: Dict[str, float] = {name: 0.0 for name in totals}
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def view(self, name: str) -> np.ndarray:
+        """Return the live rows of a column."""
+        return self.columns[name][:len(self.elements)]
+
+    def set(self, name: str, row: int, value: Any):
+        """Write one cell, keeping the column's running total current."""
+        column = self.columns[name]
+        if name in self.totals:
+            self.totals[name] += value - column[row].item()
+        column[row] = value
+
+    def set_rows(self, name: str, rows: np.ndarray, values: np.ndarray):
+        """Write a batch of cells, keeping the column's running total current."""
+        column = self.columns[name]
+        if name in self.totals:
+            self.totals[name] += float(np.sum(values) - column[rows].sum())
+        column[rows] = values
+
+    def bind(self, element: Any, **values: Any) -> int:
+        """
+        Append an element as a new row and route its column fields through it.
+        
+        Args:
+            element: Dataclass instance with an ``id``
+            **values: Values for columns that are not attributes of the element
+            
+        Returns:
+            The element's row
+        """
+        # Rebinding an ID replaces its previous row, like a dict assignment
+        if element.id in self.rows:
+            self.remove([element.id])
+        
+        row = len(self.elements)
+        if row == len(next(iter(self.columns.values()))):
+            self._grow()
+        
+        for name, column in self.columns.items():
+            column[row] = values[name] if name in values else getattr(element, name)
+            if name in self.totals:
+                self.totals[name] += column[row].item()
+        
+        self.rows[element.id] = row
+        self.elements.append(element)
+        element._store = self
+        element._row = row
+        return row
+
+    def bind_many(self, elements: List[Any], **values: Any) -> range:
+        """
+        Append a batch of elements, writing each column in one slice.
+        
+        Args:
+            elements: Dataclass instances with distinct IDs
+            **values: Values for columns that are not attributes, either one
+                per element or one shared by all
+            
+        Returns:
+            The rows of the new elements
+        """
+        # As with bind, elements replace any rows already holding their IDs
+        self.remove([e.id for e in elements if e.id in self.rows])
+        
+        start = len(self.elements)
+        end = start + len(elements)
+        while end > len(next(iter(self.columns.values()))):
+            self._grow()
+        
+        for name, column in self.columns.items():
+            column[start:end] = (
+                values[name] if name in values else [getattr(e, name) for e in elements]
+            )
+            if name in self.totals:
+                self.totals[name] += float(column[start:end].sum())
+        
+        for row, element in enumerate(elements, start):
+            self.rows[element.id] = row
+            element._store = self
+            element._row = row
+        self.elements.extend(elements)
+        return range(start, end)
+
+    def remove(self, element_ids: Iterable[str]):
+        """Drop the rows of the given element IDs, ignoring unknown IDs."""
+        rows = [self.rows[element_id] for element_id in element_ids if element_id in self.rows]
+        if rows:
+            self.remove_rows(np.asarray(rows))
+
+    def remove_rows(self, rows: np.ndarray):
+        """
+        Drop rows, compacting the survivors so row order stays insertion order.
+        
+        Removed elements get their current values back as plain attributes,
+        so any caller still holding one keeps a working object.
+        """
+        if len(rows) == 0:
+            return
+        
+        count = len(self.elements)
+        keep = np.ones(count, dtype=bool)
+        keep[rows] = False
+        
+        for row in rows:
+            self._unbind(self.elements[row])
+        
+        kept = int(keep.sum())
+        for name in self.totals:
+            if kept:
+                self.totals[name] -= float(self.columns[name][rows].sum())
+            else:
+                # Reset exactly when emptied so rounding drift cannot linger
+                self.totals[name] = 0.0
+        
+        for column in self.columns.values():
+            column[:kept] = column[:count][keep]
+        
+        self.elements = [element for element, alive in zip(self.elements, keep) if alive]
+        for row in range(int(rows.min()), kept):
+            element = self.elements[row]
+            element._row = row
+            self.rows[element.id] = row
+
+    def _unbind(self, element: Any):
+        """Move an element's column values back onto the instance."""
+        del self.rows[element.id]
+        descriptors = vars(type(element))
+        values = {
+            name: column[element._row].item()
+            for name, column in self.columns.items()
+            if isinstance(descriptors.get(name), _Column)
+        }
+        element._store = None
+        element._row = -1
+        for name, value in values.items():
+            setattr(element, name, value)
+
+    def _grow(self):
+        """Double the capacity of every column."""
+        for name, column in self.columns.items():
+            grown = np.zeros((2 * len(column),) + column.shape[1:], dtype=column.dtype)
+            grown[:len(column)] = column
+            self.columns[name] = grown
+
+
+class _SpatialGrid:
+    """
+    Uniform hash grid bucketing store rows by cell for radius queries.
+    
+    A query only visits the cells its radius can reach, so neighbor lookups
+    cost O(1) expected instead of a scan over every row. The grid is
+    insert-only, matching stores whose rows are never removed.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int, int], List[int]] = defaultdict(list)
+
+    def insert(self, position: Tuple[float, float, float], row: int):
+        """Bucket a row under the cell containing position."""
+        self.cells[self._cell(position)].append(row)
+
+    def candidates(self, position: Tuple[float, float, float], radius: float) -> List[int]:
+        """Return the rows in every cell within radius of position."""
+        span = math.ceil(radius / self.cell_size)
+        cx, cy, cz = self._cell(position)
+        cells = self.cells
+        rows = []
+        for x in range(cx - span, cx + span + 1):
+            for y in range(cy - span, cy + span + 1):
+                for z in range(cz - span, cz + span + 1):
+                    bucket = cells.get((x, y, z))
+                    if bucket:
+                        rows.extend(bucket)
+        return rows
+
+    def _cell(self, position: Tuple[float, float, float]) -> Tuple[int, int, int]:
+        cell_size = self.cell_size
+        floor = math.floor
+        x, y, z = position
+        return floor(x / cell_size), floor(y / cell_size), floor(z / cell_size)
+
+
+def _find_root(parent: List[int], row: int) -> int:
+    """Return the union-find root of row, halving the path on the way."""
+    while parent[row] != row:
+        parent[row] = parent[parent[row]]
+        row = parent[row]
+    return row
+
+
+class _StoredElement:
+    """Base for field elements whose numeric fields can live in an _ElementStore."""
+
+    __slots__ = ("_store", "_row")
+
+    def __new__(cls, *args, **kwargs):
+        element = super().__new__(cls)
+        # Unbound until the engine mirrors the element into a store
+        element._store = None
+        element._row = -1
+        return element
+
+
+def _with_slots(cls):
+    """
+    Recreate a dataclass with __slots__, like dataclass(slots=True) on 3.10+.
+    
+    Column descriptors stay on the class and get a slot for their unbound
+    value instead, which the standard library version would not preserve.
+    """
+    cls_dict = dict(cls.__dict__)
+    slots = []
+    for f in fields(cls):
+        descriptor = cls_dict.get(f.name)
+        if isinstance(descriptor, _Column):
+            slots.append(descriptor.local_name)
+        else:
+            slots.append(f.name)
+            cls_dict.pop(f.name, None)
+    
+    cls_dict["__slots__"] = tuple(slots)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@_with_slots
 @dataclass
-class FieldAttractor:
+class FieldAttractor(_StoredElement):
     """Represents an attractor in the context field."""
     id: str
     position: Tuple[float, float, float]  # 3D position in field space
-    strength: float
+    strength: float = _Column()
     attractor_type: AttractorType
     concept: str
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -66,17 +381,18 @@ class FieldAttractor:
         self.strength = min(1.0, self.strength + 0.1)
 
 
+@_with_slots
 @dataclass
-class SymbolicResidue:
+class SymbolicResidue(_StoredElement):
     """Represents symbolic residue left by field operations."""
     id: str
     symbol: str
     meaning: str
     context: str
     position: Tuple[float, float, float]
-    decay_rate: float
+    decay_rate: float = _Column()
     created: datetime = field(default_factory=datetime.now)
-    strength: float = 1.0
+    strength: float = _Column(default=1.0)
     associated_attractors: List[str] = field(default_factory=list)
 
     def decay(self, time_delta: float):
@@ -84,37 +400,40 @@ class SymbolicResidue:
         self.strength *= math.exp(-self.decay_rate * time_delta)
 
 
+@_with_slots
 @dataclass
-class FieldResonance:
+class FieldResonance(_StoredElement):
     """Represents resonance patterns between field elements."""
     id: str
     source_ids: List[str]
-    frequency: float
-    amplitude: float
+    frequency: float = _Column()
+    amplitude: float = _Column()
     phase: float
     resonance_type: str
     created: datetime = field(default_factory=datetime.now)
-    coherence_score: float = 0.0
+    coherence_score: float = _Column(default=0.0)
 
-    def update_coherence(self, field_state: Dict[str, Any]):
-        """Update coherence score based on field state."""
+    def update_coherence(self):
+        """Update coherence score from amplitude and frequency."""
         # Simplified coherence calculation
         self.coherence_score = min(1.0, self.amplitude * 0.8 + self.frequency * 0.2)
 
 
+@_with_slots
 @dataclass
-class EmergentPattern:
+class EmergentPattern(_StoredElement):
     """Represents an emergent pattern detected in the field."""
     id: str
     pattern_type: str
     elements: List[str]
-    emergence_strength: float
-    stability: float
+    emergence_strength: float = _Column()
+    stability: float = _Column()
     created: datetime = field(default_factory=datetime.now)
     lifecycle_stage: str = "forming"  # forming, stabilizing, mature, decaying
     properties: Dict[str, Any] = field(default_factory=dict)
 
 
+@_with_slots
 @dataclass
 class ProtocolExecution:
     """Represents the execution state of a protocol in the field."""
@@ -125,7 +444,7 @@ class ProtocolExecution:
     created_attractors: List[str]
     created_residues: List[str]
     resonance_effects: List[str]
-    execution_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    execution_id: str = field(default_factory=_next_execution_id)
     started: datetime = field(default_factory=datetime.now)
     completed: Optional[datetime] = None
 
@@ -143,23 +462,84 @@ class ContextFieldEngine:
     - Meta-recursive capabilities for self-improvement
     """
 
-    def __init__(self, field_dimensions: Tuple[int, int, int] = (100, 100, 100)):
-        """Initialize the context field engine."""
+    def __init__(self, field_dimensions: Tuple[int, int, int] = (100, 100, 100),
+                 reflection_history_limit: int = 1024):
+        """
+        Initialize the context field engine.
+        
+        Args:
+            field_dimensions: Extent of the field space along each axis
+            reflection_history_limit: Most recent self-reflections to retain
+        """
         self.field_dimensions = field_dimensions
         self.attractors: Dict[str, FieldAttractor] = {}
         self.symbolic_residues: Dict[str, SymbolicResidue] = {}
         self.resonance_patterns: Dict[str, FieldResonance] = {}
-        self.emergent_patterns: Dict[str, EmergentPattern] = {}
+        self._emergent_patterns: Dict[str, EmergentPattern] = {}
         self.protocol_executions: Dict[str, ProtocolExecution] = {}
         
+        # Structure-of-arrays mirror of the attractors for vectorized queries
+        self._attractor_store = _ElementStore({
+            "position": (_POSITION_DTYPE, (3,)),
+            "strength": (np.float64, ()),
+            "type_code": (np.int8, ()),
+            "cluster_seed": (np.bool_, ())
+        }, totals=("strength",))
+        self._attractor_grid = _SpatialGrid(cell_size=20.0)
+        self._residue_store = _ElementStore({
+            "strength": (np.float64, ()),
+            "decay_rate": (np.float64, ()),
+            "prefix_code": (np.int64, ())
+        })
+        # Integer codes for the meaning prefixes residues converge on
+        self._meaning_prefix_codes: Dict[str, int] = {}
+        self._resonance_store = _ElementStore({
+            "frequency": (np.float64, ()),
+            "amplitude": (np.float64, ()),
+            "coherence_score": (np.float64, ())
+        }, totals=("amplitude", "coherence_score"))
+        self._pattern_store = _ElementStore({
+            "emergence_strength": (np.float64, ()),
+            "stability": (np.float64, ())
+        }, totals=("emergence_strength", "stability"))
+        
+        # Incremental cluster and network memberships: each seed row maps to
+        # its member rows, and rows below the watermarks are already assigned
+        self._attractor_clusters: Dict[int, List[int]] = {}
+        self._clustered_rows = 0
+        self._resonance_networks: Dict[int, List[int]] = {}
+        self._network_seed_by_source: Dict[str, int] = {}
+        self._networked_rows = 0
+        
+        # Causal links per element, kept current as resonances and patterns change
+        self._causal_relationships: Dict[str, List[str]] = defaultdict(list)
+        
         # Field state
         self.field_energy = 1.0
         self.coherence_threshold = 0.7
         self.emergence_threshold = 0.8
         self.resonance_frequency_base = 1.0
         
-        # Meta-recursive state
-        self.self_reflection_history: List[Dict[str, Any]] = []
+        # Set when attractors changed since patterns were last detected
+        self._patterns_dirty = False
+        
+        # Shared creation timestamp while a batch runs under _tick()
+        self._tick_now: Optional[datetime] = None
+        
+        # Protocol executors by name; unknown protocols run the generic one
+        self._protocol_executors: Dict[str, Callable[[ProtocolExecution], None]] = {
+            "attractor_co_emerge": self._execute_attractor_co_emerge,
+            "recursive_emergence": self._execute_recursive_emergence,
+            "field_resonance_scaffold": self._execute_field_resonance_scaffold,
+            "symbolic_mechanism": self._execute_symbolic_mechanism,
+            "meta_recursive_framework": self._execute_meta_recursive_framework
+        }
+        
+        # Meta-recursive state; the history is bounded so long-running
+        # sessions keep only the latest reflections
+        self.self_reflection_history: Deque[Dict[str, Any]] = deque(
+            maxlen=reflection_history_limit
+        )
         self.improvement_cycles: int = 0
         
         # Make enums accessible as class attributes
@@ -183,8 +563,15 @@ class ContextFieldEngine:
             ("learning", AttractorType.PATTERN, (75, 75, 75))
         ]
         
-        for concept, attr_type, position in core_attractors:
-            self.create_attractor(concept, attr_type, position, strength=0.8)
+        with self._tick():
+            for concept, attr_type, position in core_attractors:
+                self.create_attractor(concept, attr_type, position, strength=0.8)
+
+    @property
+    def emergent_patterns(self) -> Dict[str, EmergentPattern]:
+        """Detected emergent patterns, brought up to date on access."""
+        self._ensure_patterns_detected()
+        return self._emergent_patterns
 
     def create_attractor(self, concept: str, attractor_type: AttractorType, 
                         position: Tuple[float, float, float], strength: float = 0.5) -> str:
@@ -200,23 +587,84 @@ class ContextFieldEngine:
         Returns:
             Attractor ID
         """
-        attractor_id = f"attr_{len(self.attractors)}_{concept.replace(' ', '_')}"
+        attractor_id = sys.intern(f"attr_{len(self.attractors)}_{concept.replace(' ', '_')}")
         
         attractor = FieldAttractor(
             id=attractor_id,
             position=position,
             strength=strength,
             attractor_type=attractor_type,
-            concept=concept
+            concept=concept,
+            created=self._now()
         )
         
         self.attractors[attractor_id] = attractor
+        row = self._attractor_store.bind(
+            attractor,
+            position=position,
+            type_code=_ATTRACTOR_TYPE_CODES[attractor_type],
+            cluster_seed=False
+        )
+        self._attractor_grid.insert(position, row)
         
-        # Check for emergent patterns with new attractor
-        self._detect_emergent_patterns()
+        # Defer pattern detection until patterns are next read, so batches
+        # of new attractors trigger one detection instead of one each
+        self._patterns_dirty = True
         
         return attractor_id
 
+    def create_attractors(self, concepts: List[str], attractor_type: AttractorType,
+                          positions: List[Tuple[float, float, float]],
+                          strength: float = 0.5) -> List[str]:
+        """
+        Create a batch of attractors of one type in a single pass.
+        
+        Args:
+            concepts: The concepts the attractors represent
+            attractor_type: Type shared by every attractor
+            positions: 3D position of each attractor, parallel to concepts
+            strength: Initial strength of every attractor
+            
+        Returns:
+            Attractor IDs, in order
+            
+        Raises:
+            ValueError: If concepts and positions differ in length
+        """
+        # zip would silently drop the unmatched tail
+        if len(concepts) != len(positions):
+            raise ValueError("concepts and positions must be the same length")
+        
+        start = len(self.attractors)
+        created = self._now()
+        attractors = [
+            FieldAttractor(
+                id=sys.intern(f"attr_{start + i}_{concept.replace(' ', '_')}"),
+                position=position,
+                strength=strength,
+                attractor_type=attractor_type,
+                concept=concept,
+                created=created
+            )
+            for i, (concept, position) in enumerate(zip(concepts, positions))
+        ]
+        attractor_ids = [attractor.id for attractor in attractors]
+        
+        self.attractors.update(zip(attractor_ids, attractors))
+        rows = self._attractor_store.bind_many(
+            attractors,
+            position=np.asarray(positions, dtype=_POSITION_DTYPE).reshape(-1, 3),
+            type_code=_ATTRACTOR_TYPE_CODES[attractor_type],
+            cluster_seed=False
+        )
+        for attractor, row in zip(attractors, rows):
+            self._attractor_grid.insert(attractor.position, row)
+        
+        if attractors:
+            self._patterns_dirty = True
+        
+        return attractor_ids
+
     def add_symbolic_residue(self, symbol: str, meaning: str, context: str,
                            position: Tuple[float, float, float], decay_rate: float = 0.01) -> str:
         """
@@ -232,7 +680,7 @@ class ContextFieldEngine:
         Returns:
             Residue ID
         """
-        residue_id = f"residue_{len(self.symbolic_residues)}_{symbol}"
+        residue_id = sys.intern(f"residue_{len(self.symbolic_residues)}_{symbol}")
         
         residue = SymbolicResidue(
             id=residue_id,
@@ -240,7 +688,8 @@ class ContextFieldEngine:
             meaning=meaning,
             context=context,
             position=position,
-            decay_rate=decay_rate
+            decay_rate=decay_rate,
+            created=self._now()
         )
         
         # Associate with nearby attractors
@@ -248,8 +697,66 @@ class ContextFieldEngine:
         residue.associated_attractors = [attr.id for attr in nearby_attractors]
         
         self.symbolic_residues[residue_id] = residue
+        prefix_codes = self._meaning_prefix_codes
+        self._residue_store.bind(
+            residue,
+            prefix_code=prefix_codes.setdefault(meaning[:20], len(prefix_codes))
+        )
         return residue_id
 
+    def add_symbolic_residues(self, symbols: List[str], meanings: List[str], context: str,
+                              positions: List[Tuple[float, float, float]],
+                              decay_rate: float = 0.01) -> List[str]:
+        """
+        Add a batch of symbolic residues sharing one context in a single pass.
+        
+        Args:
+            symbols: The symbolic representations
+            meanings: What each symbol means, parallel to symbols
+            context: Context in which they were created
+            positions: Position of each residue, parallel to symbols
+            decay_rate: Rate at which every residue decays
+            
+        Returns:
+            Residue IDs, in order
+            
+        Raises:
+            ValueError: If symbols, meanings and positions differ in length
+        """
+        # zip would silently drop the unmatched tail
+        if not len(symbols) == len(meanings) == len(positions):
+            raise ValueError("symbols, meanings and positions must be the same length")
+        
+        start = len(self.symbolic_residues)
+        created = self._now()
+        residues = [
+            SymbolicResidue(
+                id=sys.intern(f"residue_{start + i}_{symbol}"),
+                symbol=symbol,
+                meaning=meaning,
+                context=context,
+                position=position,
+                decay_rate=decay_rate,
+                created=created,
+                associated_attractors=[
+                    attr.id for attr in self._find_nearby_attractors(position, radius=20.0)
+                ]
+            )
+            for i, (symbol, meaning, position) in enumerate(zip(symbols, meanings, positions))
+        ]
+        residue_ids = [residue.id for residue in residues]
+        
+        self.symbolic_residues.update(zip(residue_ids, residues))
+        prefix_codes = self._meaning_prefix_codes
+        self._residue_store.bind_many(
+            residues,
+            prefix_code=[
+                prefix_codes.setdefault(residue.meaning[:20], len(prefix_codes))
+                for residue in residues
+            ]
+        )
+        return residue_ids
+
     def create_resonance(self, source_ids: List[str], frequency: float, 
                         amplitude: float, resonance_type: str = "harmonic") -> str:
         """
@@ -264,7 +771,7 @@ class ContextFieldEngine:
         Returns:
             Resonance ID
         """
-        resonance_id = f"resonance_{len(self.resonance_patterns)}"
+        resonance_id = sys.intern(f"resonance_{len(self.resonance_patterns)}")
         
         resonance = FieldResonance(
             id=resonance_id,
@@ -272,11 +779,14 @@ class ContextFieldEngine:
             frequency=frequency,
             amplitude=amplitude,
             phase=0.0,
-            resonance_type=resonance_type
+            resonance_type=resonance_type,
+            created=self._now()
         )
         
-        resonance.update_coherence(self._get_field_state())
+        resonance.update_coherence()
         self.resonance_patterns[resonance_id] = resonance
+        self._resonance_store.bind(resonance)
+        self._link_causes(source_ids, f"creates_resonance:{resonance_id}")
         
         return resonance_id
 
@@ -291,34 +801,44 @@ class ContextFieldEngine:
         Returns:
             Execution ID
         """
-        execution = ProtocolExecution(
-            protocol_name=protocol_name,
-            state=ProtocolState.INITIALIZING,
-            input_context=context,
-            field_modifications=[],
-            created_attractors=[],
-            created_residues=[],
-            resonance_effects=[]
-        )
-        
-        self.protocol_executions[execution.execution_id] = execution
-        
-        # Execute protocol based on type
-        if protocol_name == "attractor_co_emerge":
-            self._execute_attractor_co_emerge(execution)
-        elif protocol_name == "recursive_emergence":
-            self._execute_recursive_emergence(execution)
-        elif protocol_name == "field_resonance_scaffold":
-            self._execute_field_resonance_scaffold(execution)
-        elif protocol_name == "symbolic_mechanism":
-            self._execute_symbolic_mechanism(execution)
-        elif protocol_name == "meta_recursive_framework":
-            self._execute_meta_recursive_framework(execution)
-        else:
-            self._execute_generic_protocol(execution)
+        # Everything a protocol creates shares its start timestamp
+        with self._tick():
+            execution = ProtocolExecution(
+                protocol_name=protocol_name,
+                state=ProtocolState.INITIALIZING,
+                input_context=context,
+                field_modifications=[],
+                created_attractors=[],
+                created_residues=[],
+                resonance_effects=[],
+                started=self._now()
+            )
+            
+            self.protocol_executions[execution.execution_id] = execution
+            
+            # Execute protocol based on type
+            executor = self._protocol_executors.get(protocol_name, self._execute_generic_protocol)
+            executor(execution)
         
         return execution.execution_id
 
+    def execute_protocols(self, protocols: Iterable[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """
+        Execute a queue of protocols as one batch.
+        
+        Protocols run in order, since each can read what earlier ones created.
+        The whole batch shares one tick timestamp, and pattern detection
+        triggered by new attractors is deferred until patterns are next read.
+        
+        Args:
+            protocols: (protocol name, input context) pairs
+            
+        Returns:
+            Execution IDs, in order
+        """
+        with self._tick():
+            return [self.execute_protocol(name, context) for name, context in protocols]
+
     def detect_emergence(self) -> List[EmergentPattern]:
         """
         Detect emergent patterns in the current field state.
@@ -338,8 +858,7 @@ class ContextFieldEngine:
         if not self.resonance_patterns:
             return 0.0
         
-        total_coherence = sum(r.coherence_score for r in self.resonance_patterns.values())
-        return total_coherence / len(self.resonance_patterns)
+        return self._resonance_store.totals["coherence_score"] / len(self.resonance_patterns)
 
     def get_field_energy(self) -> float:
         """
@@ -348,9 +867,11 @@ class ContextFieldEngine:
         Returns:
             Field energy level
         """
-        attractor_energy = sum(a.strength for a in self.attractors.values())
-        resonance_energy = sum(r.amplitude for r in self.resonance_patterns.values())
-        emergence_energy = sum(p.emergence_strength for p in self.emergent_patterns.values())
+        self._ensure_patterns_detected()
+        
+        attractor_energy = self._attractor_store.totals["strength"]
+        resonance_energy = self._resonance_store.totals["amplitude"]
+        emergence_energy = self._pattern_store.totals["emergence_strength"]
         
         return attractor_energy + resonance_energy + emergence_energy
 
@@ -361,15 +882,16 @@ class ContextFieldEngine:
         Args:
             time_delta: Time step for evolution
         """
-        # Decay symbolic residues
-        for residue in self.symbolic_residues.values():
-            residue.decay(time_delta)
+        # Decay all symbolic residues in one vectorized pass, computing the
+        # decay factors in a single scratch array
+        store = self._residue_store
+        strengths = store.view("strength")
+        factors = np.multiply(store.view("decay_rate"), -time_delta)
+        np.exp(factors, out=factors)
+        strengths *= factors
         
         # Remove very weak residues
-        weak_residues = [rid for rid, residue in self.symbolic_residues.items() 
-                        if residue.strength < 0.01]
-        for rid in weak_residues:
-            del self.symbolic_residues[rid]
+        self._remove_residue_rows(np.flatnonzero(strengths < 0.01))
         
         # Update emergent pattern lifecycles
         self._update_emergent_lifecycles()
@@ -387,8 +909,6 @@ class ContextFieldEngine:
         Returns:
             Self-reflection analysis
         """
-        field_state = self._get_field_state()
-        
         reflection = {
             "timestamp": datetime.now().isoformat(),
             "cycle": self.improvement_cycles,
@@ -434,26 +954,39 @@ class ContextFieldEngine:
         Returns:
             Interpretability map with attribution and causal traces
         """
+        # Read numeric fields as whole columns rather than per element;
+        # store rows follow the same creation order as the element dicts
+        attractor_store = self._attractor_store
+        resonance_store = self._resonance_store
+        
         return {
             "field_structure": {
                 "attractors": {
-                    aid: {
+                    attr.id: {
                         "concept": attr.concept,
-                        "type": attr.attractor_type.value,
-                        "strength": attr.strength,
+                        "type": _ATTRACTOR_TYPE_NAMES[type_code],
+                        "strength": strength,
                         "activation_count": attr.activation_count,
                         "position": attr.position
                     }
-                    for aid, attr in self.attractors.items()
+                    for attr, strength, type_code in zip(
+                        attractor_store.elements,
+                        attractor_store.view("strength").tolist(),
+                        attractor_store.view("type_code").tolist()
+                    )
                 },
                 "resonances": {
-                    rid: {
+                    res.id: {
                         "sources": res.source_ids,
-                        "frequency": res.frequency,
-                        "coherence": res.coherence_score,
+                        "frequency": frequency,
+                        "coherence": coherence,
                         "type": res.resonance_type
                     }
-                    for rid, res in self.resonance_patterns.items()
+                    for res, frequency, coherence in zip(
+                        resonance_store.elements,
+                        resonance_store.view("frequency").tolist(),
+                        resonance_store.view("coherence_score").tolist()
+                    )
                 }
             },
             "emergence_trace": {
@@ -466,7 +999,7 @@ class ContextFieldEngine:
                 for pid, pattern in self.emergent_patterns.items()
             },
             "symbolic_landscape": {
-                "active_symbols": len([r for r in self.symbolic_residues.values() if r.strength > 0.1]),
+                "active_symbols": int(np.count_nonzero(self._residue_store.view("strength") > 0.1)),
                 "decay_patterns": self._analyze_residue_decay(),
                 "symbol_clusters": self._cluster_symbolic_residues()
             },
@@ -475,162 +1008,271 @@ class ContextFieldEngine:
 
     # Private helper methods
 
-    def _get_field_state(self) -> Dict[str, Any]:
-        """Get current field state."""
-        return {
-            "attractors": self.attractors,
-            "residues": self.symbolic_residues,
-            "resonances": self.resonance_patterns,
-            "patterns": self.emergent_patterns,
-            "energy": self.field_energy,
-            "coherence": self.get_field_coherence()
-        }
+    @contextmanager
+    def _tick(self):
+        """Stamp every element created inside the block with one timestamp."""
+        if self._tick_now is not None:
+            yield
+            return
+        
+        self._tick_now = datetime.now()
+        try:
+            yield
+        finally:
+            self._tick_now = None
+
+    def _now(self) -> datetime:
+        """Return the current tick timestamp, or the wall clock outside a tick."""
+        return self._tick_now or datetime.now()
+
+    def _remove_residue_rows(self, rows: np.ndarray):
+        """Drop residues by store row from both the store and the residue dict."""
+        store = self._residue_store
+        residues = self.symbolic_residues
+        removed_ids = [store.elements[row].id for row in rows.tolist()]
+        
+        # Refilling the dict with the survivors beats deleting most of it
+        # entry by entry, which would leave it full of dummy slots
+        if len(removed_ids) > len(residues) // 2:
+            removed = set(removed_ids)
+            survivors = [(rid, r) for rid, r in residues.items() if rid not in removed]
+            residues.clear()
+            residues.update(survivors)
+        else:
+            for rid in removed_ids:
+                residues.pop(rid, None)
+        
+        store.remove_rows(rows)
 
     def _find_nearby_attractors(self, position: Tuple[float, float, float], 
                                radius: float) -> List[FieldAttractor]:
         """Find attractors within radius of position."""
-        nearby = []
-        px, py, pz = position
+        rows = self._attractor_grid.candidates(position, radius)
+        if not rows:
+            return []
         
-        for attractor in self.attractors.values():
-            ax, ay, az = attractor.position
-            distance = math.sqrt((px-ax)**2 + (py-ay)**2 + (pz-az)**2)
-            if distance <= radius:
-                nearby.append(attractor)
+        # Squared distances to the candidates in one vectorized pass, keeping
+        # rows sorted so results come back in insertion order
+        store = self._attractor_store
+        rows = np.sort(np.asarray(rows))
+        offsets = store.view("position")[rows] - np.asarray(position, dtype=_POSITION_DTYPE)
+        distances_sq = np.einsum("ij,ij->i", offsets, offsets)
         
-        return nearby
+        elements = store.elements
+        return [elements[row] for row in rows[distances_sq <= radius * radius]]
+
+    def _ensure_patterns_detected(self):
+        """Run any pattern detection deferred by attractor creation."""
+        if self._patterns_dirty:
+            self._detect_emergent_patterns()
 
     def _detect_emergent_patterns(self) -> List[EmergentPattern]:
         """Detect emergent patterns in current field state."""
+        self._patterns_dirty = False
         patterns = []
+        created = self._now()
         
-        # Pattern 1: Attractor clusters
-        clusters = self._find_attractor_clusters()
-        for cluster in clusters:
-            if len(cluster) >= 3:  # Minimum cluster size
-                pattern_id = f"cluster_{len(patterns)}"
-                pattern = EmergentPattern(
-                    id=pattern_id,
-                    pattern_type="attractor_cluster",
-                    elements=[a.id for a in cluster],
-                    emergence_strength=len(cluster) / 10.0,  # Normalize
-                    stability=self._calculate_cluster_stability(cluster)
-                )
-                patterns.append(pattern)
-                self.emergent_patterns[pattern_id] = pattern
+        # Pattern 1: Attractor clusters, scored together from their store rows
+        self._assign_new_attractors_to_clusters()
+        clusters = [
+            members for members in self._attractor_clusters.values()
+            if len(members) >= 3  # Minimum cluster size
+        ]
+        stabilities = self._calculate_cluster_stabilities(clusters)
+        attractors = self._attractor_store.elements
+        for cluster, stability in zip(clusters, stabilities):
+            pattern_id = sys.intern(f"cluster_{len(patterns)}")
+            pattern = EmergentPattern(
+                id=pattern_id,
+                pattern_type="attractor_cluster",
+                elements=[attractors[row].id for row in cluster],
+                emergence_strength=len(cluster) / 10.0,  # Normalize
+                stability=stability,
+                created=created
+            )
+            patterns.append(pattern)
+            self._add_emergent_pattern(pattern)
         
         # Pattern 2: Resonance networks
         networks = self._find_resonance_networks()
         for network in networks:
             if len(network) >= 2:
-                pattern_id = f"resonance_network_{len(patterns)}"
+                pattern_id = sys.intern(f"resonance_network_{len(patterns)}")
                 pattern = EmergentPattern(
                     id=pattern_id,
                     pattern_type="resonance_network",
                     elements=network,
                     emergence_strength=len(network) / 5.0,
-                    stability=self._calculate_network_stability(network)
+                    stability=self._calculate_network_stability(network),
+                    created=created
                 )
                 patterns.append(pattern)
-                self.emergent_patterns[pattern_id] = pattern
+                self._add_emergent_pattern(pattern)
         
         # Pattern 3: Symbolic convergence
         convergences = self._find_symbolic_convergences()
         for convergence in convergences:
-            pattern_id = f"symbolic_convergence_{len(patterns)}"
+            pattern_id = sys.intern(f"symbolic_convergence_{len(patterns)}")
             pattern = EmergentPattern(
                 id=pattern_id,
                 pattern_type="symbolic_convergence",
                 elements=convergence,
                 emergence_strength=len(convergence) / 8.0,
-                stability=0.7  # Symbolic patterns tend to be stable
+                stability=0.7,  # Symbolic patterns tend to be stable
+                created=created
             )
             patterns.append(pattern)
-            self.emergent_patterns[pattern_id] = pattern
+            self._add_emergent_pattern(pattern)
         
         return patterns
 
+    def _add_emergent_pattern(self, pattern: EmergentPattern):
+        """Record a pattern, replacing any earlier pattern with the same ID."""
+        replaced = self._emergent_patterns.get(pattern.id)
+        if replaced is not None:
+            self._unlink_causes(replaced.elements, f"contributes_to_pattern:{replaced.id}")
+        
+        self._emergent_patterns[pattern.id] = pattern
+        self._pattern_store.bind(pattern)
+        self._link_causes(pattern.elements, f"contributes_to_pattern:{pattern.id}")
+
+    def _link_causes(self, element_ids: Iterable[str], link: str):
+        """Record a causal link from each element."""
+        relationships = self._causal_relationships
+        for element_id in element_ids:
+            relationships[element_id].append(link)
+
+    def _unlink_causes(self, element_ids: Iterable[str], link: str):
+        """Drop one recorded causal link from each element."""
+        relationships = self._causal_relationships
+        for element_id in element_ids:
+            links = relationships.get(element_id)
+            if links and link in links:
+                links.remove(link)
+                if not links:
+                    del relationships[element_id]
+
     def _find_attractor_clusters(self) -> List[List[FieldAttractor]]:
         """Find clusters of attractors based on proximity and type."""
-        clusters = []
-        processed = set()
+        self._assign_new_attractors_to_clusters()
         
-        for attractor in self.attractors.values():
-            if attractor.id in processed:
-                continue
-            
-            cluster = [attractor]
-            processed.add(attractor.id)
+        elements = self._attractor_store.elements
+        return [
+            [elements[row] for row in members]
+            for members in self._attractor_clusters.values()
+            if len(members) > 1
+        ]
+
+    def _assign_new_attractors_to_clusters(self):
+        """
+        Fold attractors added since the last detection into the clusters.
+        
+        Clusters form greedily in insertion order: each unclaimed attractor
+        seeds a cluster and claims the unclaimed attractors of its type within
+        range. A newer attractor therefore never changes earlier assignments
+        and simply joins the first seed that can claim it, so only the new
+        rows need checking against the seeds around them.
+        """
+        store = self._attractor_store
+        positions = store.view("position")
+        type_codes = store.view("type_code")
+        seeds = store.view("cluster_seed")
+        elements = store.elements
+        
+        for row in range(self._clustered_rows, len(store)):
+            candidates = np.asarray(self._attractor_grid.candidates(elements[row].position, 30.0))
+            candidates = candidates[candidates < row]
             
-            # Find nearby attractors of similar type
-            nearby = self._find_nearby_attractors(attractor.position, radius=30.0)
-            for near_attr in nearby:
-                if (near_attr.id not in processed and 
-                    near_attr.attractor_type == attractor.attractor_type):
-                    cluster.append(near_attr)
-                    processed.add(near_attr.id)
+            offsets = positions[candidates] - positions[row]
+            claimants = candidates[
+                (np.einsum("ij,ij->i", offsets, offsets) <= 30.0 * 30.0) &
+                (type_codes[candidates] == type_codes[row]) &
+                seeds[candidates]
+            ]
             
-            if len(cluster) > 1:
-                clusters.append(cluster)
+            if len(claimants):
+                self._attractor_clusters[int(claimants.min())].append(row)
+            else:
+                seeds[row] = True
+                self._attractor_clusters[row] = [row]
         
-        return clusters
+        self._clustered_rows = len(store)
 
     def _find_resonance_networks(self) -> List[List[str]]:
         """Find networks of connected resonances."""
-        networks = []
-        processed = set()
-        
-        for resonance in self.resonance_patterns.values():
-            if resonance.id in processed:
-                continue
-            
-            network = [resonance.id]
-            processed.add(resonance.id)
-            
-            # Find connected resonances (sharing source elements)
-            for other_res in self.resonance_patterns.values():
-                if (other_res.id not in processed and
-                    set(resonance.source_ids) & set(other_res.source_ids)):
-                    network.append(other_res.id)
-                    processed.add(other_res.id)
-            
-            if len(network) > 1:
-                networks.append(network)
-        
-        return networks
+        store = self._resonance_store
+        elements = store.elements
+        
+        # Fold in new resonances: like clusters, each joins the first seed
+        # sharing a source element or else seeds a network of its own. Seeds
+        # are indexed by source, keeping the earliest seed for each element
+        seed_by_source = self._network_seed_by_source
+        for row in range(self._networked_rows, len(store)):
+            sources = elements[row].source_ids
+            seeds = [seed_by_source[sid] for sid in sources if sid in seed_by_source]
+            if seeds:
+                self._resonance_networks[min(seeds)].append(row)
+            else:
+                for sid in sources:
+                    seed_by_source.setdefault(sid, row)
+                self._resonance_networks[row] = [row]
+        
+        self._networked_rows = len(store)
+        
+        return [
+            [elements[row].id for row in members]
+            for members in self._resonance_networks.values()
+            if len(members) > 1
+        ]
 
     def _find_symbolic_convergences(self) -> List[List[str]]:
         """Find convergences of symbolic residues."""
-        convergences = []
-        residue_groups = {}
-        
-        # Group residues by meaning similarity
-        for residue in self.symbolic_residues.values():
-            if residue.strength > 0.1:  # Only consider strong residues
-                key = residue.meaning[:20]  # Simple grouping by meaning prefix
-                if key not in residue_groups:
-                    residue_groups[key] = []
-                residue_groups[key].append(residue.id)
-        
-        # Find groups with multiple residues
-        for group in residue_groups.values():
-            if len(group) >= 3:
-                convergences.append(group)
-        
-        return convergences
-
-    def _calculate_cluster_stability(self, cluster: List[FieldAttractor]) -> float:
-        """Calculate stability of an attractor cluster."""
-        if len(cluster) <= 1:
-            return 0.0
+        store = self._residue_store
         
-        # Calculate variance in strengths
-        strengths = [a.strength for a in cluster]
-        mean_strength = sum(strengths) / len(strengths)
-        variance = sum((s - mean_strength)**2 for s in strengths) / len(strengths)
+        # Only consider strong residues
+        strong_rows = np.flatnonzero(store.view("strength") > 0.1)
+        if len(strong_rows) == 0:
+            return []
+        
+        # Group residues by meaning prefix code in one vectorized pass
+        _, first_seen, groups, counts = np.unique(
+            store.view("prefix_code")[strong_rows],
+            return_index=True, return_inverse=True, return_counts=True
+        )
+        
+        # Emit groups with multiple residues in order of first appearance
+        elements = store.elements
+        return [
+            [elements[row].id for row in strong_rows[groups == group]]
+            for group in sorted(np.flatnonzero(counts >= 3), key=first_seen.__getitem__)
+        ]
+
+    def _calculate_cluster_stabilities(self, clusters: List[List[int]]) -> List[float]:
+        """
+        Calculate the stability of each attractor cluster.
+        
+        Args:
+            clusters: Member store rows of each cluster
+            
+        Returns:
+            Stability per cluster, in order
+        """
+        if not clusters:
+            return []
+        
+        # Strength variance of every cluster at once, grouping member rows by
+        # cluster label instead of slicing the column once per cluster
+        sizes = np.fromiter(map(len, clusters), dtype=np.intp, count=len(clusters))
+        rows = np.fromiter(
+            itertools.chain.from_iterable(clusters), dtype=np.intp, count=int(sizes.sum())
+        )
+        labels = np.repeat(np.arange(len(clusters)), sizes)
+        strengths = self._attractor_store.view("strength")[rows]
+        deviations = strengths - (np.bincount(labels, weights=strengths) / sizes)[labels]
+        variances = np.bincount(labels, weights=deviations * deviations) / sizes
         
         # Lower variance = higher stability
-        return max(0.0, 1.0 - variance)
+        return np.maximum(0.0, 1.0 - variances).tolist()
 
     def _calculate_network_stability(self, network: List[str]) -> float:
         """Calculate stability of a resonance network."""
@@ -638,22 +1280,24 @@ class ContextFieldEngine:
             return 0.0
         
         # Calculate coherence variance
-        coherences = [self.resonance_patterns[rid].coherence_score for rid in network]
-        mean_coherence = sum(coherences) / len(coherences)
-        variance = sum((c - mean_coherence)**2 for c in coherences) / len(coherences)
+        store = self._resonance_store
+        rows = np.fromiter((store.rows[rid] for rid in network), dtype=np.intp, count=len(network))
+        variance = float(np.var(store.view("coherence_score")[rows]))
         
         return max(0.0, 1.0 - variance)
 
     def _update_emergent_lifecycles(self):
         """Update lifecycle stages of emergent patterns."""
+        now = datetime.now()
+        
         for pattern in self.emergent_patterns.values():
-            age_hours = (datetime.now() - pattern.created).total_seconds() / 3600
+            stage = pattern.lifecycle_stage
             
-            if pattern.lifecycle_stage == "forming" and age_hours > 1:
-                pattern.lifecycle_stage = "stabilizing"
-            elif pattern.lifecycle_stage == "stabilizing" and age_hours > 6:
-                pattern.lifecycle_stage = "mature"
-            elif pattern.lifecycle_stage == "mature" and pattern.stability < 0.3:
+            if stage in _AGED_LIFECYCLE_STAGES:
+                next_stage, min_age_seconds = _AGED_LIFECYCLE_STAGES[stage]
+                if (now - pattern.created).total_seconds() > min_age_seconds:
+                    pattern.lifecycle_stage = next_stage
+            elif stage == "mature" and pattern.stability < 0.3:
                 pattern.lifecycle_stage = "decaying"
 
     def _analyze_field_patterns(self) -> Dict[str, Any]:
@@ -667,58 +1311,58 @@ class ContextFieldEngine:
 
     def _get_dominant_attractor_types(self) -> Dict[str, int]:
         """Get count of each attractor type."""
-        type_counts = {}
-        for attractor in self.attractors.values():
-            attr_type = attractor.attractor_type.value
-            type_counts[attr_type] = type_counts.get(attr_type, 0) + 1
-        return type_counts
+        counts = np.bincount(
+            self._attractor_store.view("type_code"), minlength=len(_ATTRACTOR_TYPE_NAMES)
+        )
+        return {
+            _ATTRACTOR_TYPE_NAMES[code]: count
+            for code, count in enumerate(counts.tolist())
+            if count
+        }
 
     def _calculate_resonance_harmony(self) -> float:
         """Calculate harmony of resonance frequencies."""
         if not self.resonance_patterns:
             return 0.0
         
-        frequencies = [r.frequency for r in self.resonance_patterns.values()]
         # Simple harmony measure: inverse of frequency variance
-        if len(frequencies) <= 1:
+        if len(self.resonance_patterns) <= 1:
             return 1.0
         
-        mean_freq = sum(frequencies) / len(frequencies)
-        variance = sum((f - mean_freq)**2 for f in frequencies) / len(frequencies)
+        variance = float(np.var(self._resonance_store.view("frequency")))
         return 1.0 / (1.0 + variance)
 
     def _analyze_emergence_trends(self) -> Dict[str, Any]:
         """Analyze trends in emergent patterns."""
-        pattern_types = {}
+        pattern_types = defaultdict(lambda: {"count": 0, "avg_strength": 0.0})
         for pattern in self.emergent_patterns.values():
-            ptype = pattern.pattern_type
-            if ptype not in pattern_types:
-                pattern_types[ptype] = {"count": 0, "avg_strength": 0.0}
-            pattern_types[ptype]["count"] += 1
-            pattern_types[ptype]["avg_strength"] += pattern.emergence_strength
+            ptype_data = pattern_types[pattern.pattern_type]
+            ptype_data["count"] += 1
+            ptype_data["avg_strength"] += pattern.emergence_strength
         
         # Calculate averages
         for ptype_data in pattern_types.values():
             if ptype_data["count"] > 0:
                 ptype_data["avg_strength"] /= ptype_data["count"]
         
-        return pattern_types
+        return dict(pattern_types)
 
     def _calculate_symbolic_diversity(self) -> float:
         """Calculate diversity of symbolic residues."""
-        if not self.symbolic_residues:
+        residues = self.symbolic_residues
+        if not residues:
             return 0.0
         
-        symbols = set(r.symbol for r in self.symbolic_residues.values())
-        return len(symbols) / len(self.symbolic_residues)
+        symbols = {r.symbol for r in residues.values()}
+        return len(symbols) / len(residues)
 
     def _identify_improvement_opportunities(self) -> List[str]:
         """Identify opportunities for field improvement."""
         opportunities = []
         
-        # Check for weak attractors
-        weak_attractors = [a for a in self.attractors.values() if a.strength < 0.3]
-        if len(weak_attractors) > len(self.attractors) * 0.3:
+        # Check for weak attractors, counting straight off the strength column
+        attractor_strengths = self._attractor_store.view("strength")
+        if np.count_nonzero(attractor_strengths < 0.3) > len(attractor_strengths) * 0.3:
             opportunities.append("strengthen_weak_attractors")
         
         # Check field coherence
@@ -726,8 +1370,8 @@ class ContextFieldEngine:
             opportunities.append("enhance_resonance")
         
         # Check for noise (many weak residues)
-        weak_residues = [r for r in self.symbolic_residues.values() if r.strength < 0.1]
-        if len(weak_residues) > len(self.symbolic_residues) * 0.5:
+        residue_strengths = self._residue_store.view("strength")
+        if np.count_nonzero(residue_strengths < 0.1) > len(residue_strengths) * 0.5:
             opportunities.append("prune_noise")
         
         # Check for pattern consolidation opportunities
@@ -752,9 +1396,7 @@ class ContextFieldEngine:
             return 0.0
         
         # Stability based on strength variance
-        strengths = [a.strength for a in self.attractors.values()]
-        mean_strength = sum(strengths) / len(strengths)
-        variance = sum((s - mean_strength)**2 for s in strengths) / len(strengths)
+        variance = float(np.var(self._attractor_store.view("strength")))
         return max(0.0, 1.0 - variance)
 
     def _calculate_resonance_stability(self) -> float:
@@ -763,16 +1405,14 @@ class ContextFieldEngine:
             return 0.0
         
         # Stability based on coherence scores
-        coherences = [r.coherence_score for r in self.resonance_patterns.values()]
-        return sum(coherences) / len(coherences)
+        return self._resonance_store.totals["coherence_score"] / len(self.resonance_patterns)
 
     def _calculate_emergence_stability(self) -> float:
         """Calculate overall emergence stability."""
         if not self.emergent_patterns:
             return 0.0
         
-        stabilities = [p.stability for p in self.emergent_patterns.values()]
-        return sum(stabilities) / len(stabilities)
+        return self._pattern_store.totals["stability"] / len(self.emergent_patterns)
 
     def _calculate_overall_stability(self) -> float:
         """Calculate overall field stability."""
@@ -784,22 +1424,51 @@ class ContextFieldEngine:
 
     def _find_similar_patterns(self) -> List[List[str]]:
         """Find similar emergent patterns that could be consolidated."""
+        patterns = self.emergent_patterns
         similar_groups = []
         processed = set()
         
-        for pattern in self.emergent_patterns.values():
-            if pattern.id in processed:
+        # Index pattern IDs by (type, element) so only patterns of the same
+        # type sharing an element are ever compared. Patterns with fewer than
+        # two distinct elements can never share two, so they are left out
+        element_sets: Dict[str, Set[str]] = {}
+        index: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        for pid, pattern in patterns.items():
+            elements = set(pattern.elements)
+            if len(elements) > 1:
+                element_sets[pid] = elements
+                for element_id in elements:
+                    index[(pattern.pattern_type, element_id)].append(pid)
+        order = {pid: position for position, pid in enumerate(patterns)}
+        
+        for pid, pattern in patterns.items():
+            if pid in processed:
+                continue
+            processed.add(pid)
+            if pid not in element_sets:
                 continue
             
-            similar = [pattern.id]
-            processed.add(pattern.id)
+            # Only elements some other pattern also holds can be shared, and
+            # a match needs two of them, so most disjoint patterns stop here
+            postings = [
+                index[(pattern.pattern_type, element_id)] for element_id in element_sets[pid]
+            ]
+            postings = [ids for ids in postings if len(ids) > 1]
+            if len(postings) < 2:
+                continue
             
-            for other in self.emergent_patterns.values():
-                if (other.id not in processed and
-                    pattern.pattern_type == other.pattern_type and
-                    len(set(pattern.elements) & set(other.elements)) > 1):
-                    similar.append(other.id)
-                    processed.add(other.id)
+            # Count shared elements per unprocessed candidate in one pass
+            shared = Counter(
+                other_id
+                for ids in postings
+                for other_id in ids
+                if other_id not in processed
+            )
+            similar = [pid] + sorted(
+                (other_id for other_id, count in shared.items() if count > 1),
+                key=order.__getitem__
+            )
+            processed.update(similar)
             
             if len(similar) > 1:
                 similar_groups.append(similar)
@@ -808,84 +1477,132 @@ class ContextFieldEngine:
 
     def _strengthen_weak_attractors(self, threshold: float):
         """Strengthen attractors below threshold."""
-        for attractor in self.attractors.values():
-            if attractor.strength < threshold:
-                attractor.strength = min(1.0, attractor.strength + 0.2)
+        store = self._attractor_store
+        strengths = store.view("strength")
+        weak_rows = np.flatnonzero(strengths < threshold)
+        store.set_rows("strength", weak_rows, np.minimum(1.0, strengths[weak_rows] + 0.2))
 
     def _prune_field_noise(self, noise_threshold: float):
         """Remove weak residues below threshold."""
-        to_remove = [rid for rid, residue in self.symbolic_residues.items()
-                    if residue.strength < noise_threshold]
-        for rid in to_remove:
-            del self.symbolic_residues[rid]
+        store = self._residue_store
+        self._remove_residue_rows(np.flatnonzero(store.view("strength") < noise_threshold))
 
     def _enhance_field_resonance(self, frequency_adjustment: float):
         """Enhance field resonance patterns."""
-        for resonance in self.resonance_patterns.values():
-            resonance.frequency *= frequency_adjustment
-            resonance.amplitude = min(1.0, resonance.amplitude * 1.1)
+        store = self._resonance_store
+        frequencies = store.view("frequency")
+        frequencies *= frequency_adjustment
+        
+        # Amplitude carries a running total, so write it back as a batch
+        amplitudes = np.minimum(store.view("amplitude") * 1.1, 1.0)
+        store.set_rows("amplitude", np.arange(len(store)), amplitudes)
 
     def _consolidate_emergent_patterns(self, similarity_threshold: float):
         """Consolidate similar emergent patterns."""
         similar_groups = self._find_similar_patterns()
         
+        # Grouping brought detection up to date, so use the dict directly
+        emergent_patterns = self._emergent_patterns
+        emergence_strength = attrgetter("emergence_strength")
+        removed_ids = []
+        
         for group in similar_groups:
             if len(group) >= 2:
                 # Keep the strongest pattern, remove others
-                patterns = [self.emergent_patterns[pid] for pid in group]
-                strongest = max(patterns, key=lambda p: p.emergence_strength)
+                patterns = [emergent_patterns[pid] for pid in group]
+                strongest = max(patterns, key=emergence_strength)
                 
-                # Merge elements from weaker patterns
+                # Merge elements from weaker patterns, deduplicating as they
+                # are added through an insertion-ordered dict used as a set
+                merged = dict.fromkeys(strongest.elements)
                 for pattern in patterns:
-                    if pattern.id != strongest.id:
-                        strongest.elements.extend(pattern.elements)
-                        del self.emergent_patterns[pattern.id]
+                    if pattern is not strongest:
+                        merged.update(dict.fromkeys(pattern.elements))
+                        del emergent_patterns[pattern.id]
+                        removed_ids.append(pattern.id)
+                        self._unlink_causes(pattern.elements, f"contributes_to_pattern:{pattern.id}")
                 
-                # Remove duplicates
-                strongest.elements = list(set(strongest.elements))
+                link = f"contributes_to_pattern:{strongest.id}"
+                self._unlink_causes(strongest.elements, link)
+                strongest.elements = list(merged)
+                self._link_causes(strongest.elements, link)
                 strongest.emergence_strength += 0.1  # Boost from consolidation
+        
+        # Compact the pattern store once for every group
+        self._pattern_store.remove(removed_ids)
 
     def _analyze_residue_decay(self) -> Dict[str, float]:
         """Analyze symbolic residue decay patterns."""
         if not self.symbolic_residues:
             return {}
         
-        decay_rates = [r.decay_rate for r in self.symbolic_residues.values()]
+        decay_rates = self._residue_store.view("decay_rate")
         return {
-            "mean_decay_rate": sum(decay_rates) / len(decay_rates),
-            "min_decay_rate": min(decay_rates),
-            "max_decay_rate": max(decay_rates)
+            "mean_decay_rate": float(decay_rates.mean()),
+            "min_decay_rate": float(decay_rates.min()),
+            "max_decay_rate": float(decay_rates.max())
         }
 
     def _cluster_symbolic_residues(self) -> List[List[str]]:
-        """Cluster symbolic residues by position and meaning."""
-        clusters = []
-        # Simplified clustering by position proximity
-        # In production, would use more sophisticated clustering
-        return clusters
+        """
+        Cluster symbolic residues by position and meaning.
+        
+        Residues sharing a meaning prefix within 10 units of each other are
+        linked, and clusters are the connected groups of two or more.
+        """
+        store = self._residue_store
+        elements = store.elements
+        if len(elements) < 2:
+            return []
+        
+        positions = np.array([r.position for r in elements], dtype=_POSITION_DTYPE)
+        prefix_codes = store.view("prefix_code")
+        parent = list(range(len(elements)))
+        
+        # Query each residue against the earlier ones already in the grid, so
+        # every linked pair is checked once from its later row
+        grid = _SpatialGrid(10.0)
+        for row, residue in enumerate(elements):
+            candidates = np.asarray(grid.candidates(residue.position, 10.0), dtype=np.intp)
+            grid.insert(residue.position, row)
+            if not len(candidates):
+                continue
+            
+            offsets = positions[candidates] - positions[row]
+            linked = candidates[
+                (np.einsum("ij,ij->i", offsets, offsets) <= 10.0 * 10.0) &
+                (prefix_codes[candidates] == prefix_codes[row])
+            ]
+            for other in linked.tolist():
+                root, other_root = _find_root(parent, row), _find_root(parent, other)
+                if root != other_root:
+                    parent[max(root, other_root)] = min(root, other_root)
+        
+        # Groups come out ordered by their earliest residue
+        groups: Dict[int, List[str]] = defaultdict(list)
+        for row, residue in enumerate(elements):
+            groups[_find_root(parent, row)].append(residue.id)
+        
+        return [members for members in groups.values() if len(members) > 1]
 
     def _trace_causal_relationships(self) -> Dict[str, List[str]]:
         """Trace causal relationships in the field."""
-        relationships = {}
+        self._ensure_patterns_detected()
         
-        # Trace attractor -> resonance relationships
-        for resonance in self.resonance_patterns.values():
-            for source_id in resonance.source_ids:
-                if source_id not in relationships:
-                    relationships[source_id] = []
-                relationships[source_id].append(f"creates_resonance:{resonance.id}")
-        
-        # Trace resonance -> emergence relationships
-        for pattern in self.emergent_patterns.values():
-            for element_id in pattern.elements:
-                if element_id not in relationships:
-                    relationships[element_id] = []
-                relationships[element_id].append(f"contributes_to_pattern:{pattern.id}")
-        
-        return relationships
+        # Links are maintained as resonances and patterns change; hand out
+        # copies so callers cannot disturb the live index
+        return {
+            element_id: list(links)
+            for element_id, links in self._causal_relationships.items()
+        }
 
     # Protocol execution methods
 
+    def _finish(self, execution: ProtocolExecution, state: ProtocolState = ProtocolState.CONVERGED):
+        """Mark a protocol execution as finished in the given state."""
+        execution.state = state
+        execution.completed = datetime.now()
+
     def _execute_attractor_co_emerge(self, execution: ProtocolExecution):
         """Execute attractor co-emergence protocol."""
         execution.state = ProtocolState.ACTIVE
@@ -895,11 +1612,11 @@ class ContextFieldEngine:
         concepts = context.get("concepts", ["concept1", "concept2", "concept3"])
         positions = context.get("positions", [(30, 30, 30), (40, 40, 40), (50, 50, 50)])
         
-        created_attractors = []
-        for i, concept in enumerate(concepts):
-            position = positions[i] if i < len(positions) else (50, 50, 50)
-            attr_id = self.create_attractor(concept, AttractorType.CONCEPT, position)
-            created_attractors.append(attr_id)
+        created_attractors = self.create_attractors(
+            concepts,
+            AttractorType.CONCEPT,
+            [positions[i] if i < len(positions) else (50, 50, 50) for i in range(len(concepts))]
+        )
         
         # Create resonance between attractors
         if len(created_attractors) >= 2:
@@ -912,8 +1629,7 @@ class ContextFieldEngine:
             execution.resonance_effects.append(resonance_id)
         
         execution.created_attractors = created_attractors
-        execution.state = ProtocolState.CONVERGED
-        execution.completed = datetime.now()
+        self._finish(execution)
 
     def _execute_recursive_emergence(self, execution: ProtocolExecution):
         """Execute recursive emergence protocol."""
@@ -935,31 +1651,35 @@ class ContextFieldEngine:
         )
         execution.created_residues.append(residue_id)
         
-        execution.state = ProtocolState.CONVERGED
-        execution.completed = datetime.now()
+        self._finish(execution)
 
     def _execute_field_resonance_scaffold(self, execution: ProtocolExecution):
         """Execute field resonance scaffolding protocol."""
         execution.state = ProtocolState.RESONATING
         
-        # Enhance existing resonances
-        for resonance in self.resonance_patterns.values():
-            resonance.amplitude = min(1.0, resonance.amplitude * 1.2)
-            resonance.update_coherence(self._get_field_state())
+        # Enhance existing resonances, recomputing coherence as
+        # FieldResonance.update_coherence does, over whole columns
+        store = self._resonance_store
+        rows = np.arange(len(store))
+        amplitudes = np.minimum(1.0, store.view("amplitude") * 1.2)
+        store.set_rows("amplitude", rows, amplitudes)
+        store.set_rows(
+            "coherence_score", rows,
+            np.minimum(1.0, amplitudes * 0.8 + store.view("frequency") * 0.2)
+        )
         
         # Create scaffolding resonance
-        all_attractors = list(self.attractors.keys())
-        if len(all_attractors) >= 2:
+        scaffold_attractors = list(itertools.islice(self.attractors, 4))  # Connect up to 4 attractors
+        if len(scaffold_attractors) >= 2:
             scaffold_resonance = self.create_resonance(
-                all_attractors[:4],  # Connect up to 4 attractors
+                scaffold_attractors,
                 frequency=self.resonance_frequency_base,
                 amplitude=0.9,
                 resonance_type="scaffold"
             )
             execution.resonance_effects.append(scaffold_resonance)
         
-        execution.state = ProtocolState.CONVERGED
-        execution.completed = datetime.now()
+        self._finish(execution)
 
     def _execute_symbolic_mechanism(self, execution: ProtocolExecution):
         """Execute symbolic mechanism protocol."""
@@ -969,18 +1689,14 @@ class ContextFieldEngine:
         symbols = context.get("symbols", ["⊕", "⊗", "⊙"])
         meanings = context.get("meanings", ["combine", "transform", "focus"])
         
-        for i, symbol in enumerate(symbols):
-            meaning = meanings[i] if i < len(meanings) else "symbolic_operation"
-            residue_id = self.add_symbolic_residue(
-                symbol=symbol,
-                meaning=meaning,
-                context="symbolic_mechanism",
-                position=(20 + i*10, 80, 20 + i*10)
-            )
-            execution.created_residues.append(residue_id)
+        execution.created_residues.extend(self.add_symbolic_residues(
+            symbols,
+            [meanings[i] if i < len(meanings) else "symbolic_operation" for i in range(len(symbols))],
+            "symbolic_mechanism",
+            [(20 + i*10, 80, 20 + i*10) for i in range(len(symbols))]
+        ))
         
-        execution.state = ProtocolState.CONVERGED
-        execution.completed = datetime.now()
+        self._finish(execution)
 
     def _execute_meta_recursive_framework(self, execution: ProtocolExecution):
         """Execute meta-recursive framework protocol."""
@@ -1003,8 +1719,7 @@ class ContextFieldEngine:
         for improvement in improvements[:2]:  # Apply up to 2 improvements
             self.apply_improvement(improvement, {})
         
-        execution.state = ProtocolState.CONVERGED
-        execution.completed = datetime.now()
+        self._finish(execution)
 
     def _execute_generic_protocol(self, execution: ProtocolExecution):
         """Execute a generic protocol."""
@@ -1019,5 +1734,4 @@ class ContextFieldEngine:
         )
         execution.created_attractors.append(attr_id)
         
-        execution.state = ProtocolState.CONVERGED
-        execution.completed = datetime.now()
\ No newline at end of file
+        self._finish(execution)
\ No newline at end of file
@@ -25,12 +25,24 @@ from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import copy
+import heapq
 import logging
+from functools import lru_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=4096)
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words, memoized since patterns rarely change."""
+    return len(text.split())
+
+@lru_cache(maxsize=4096)
+def _pattern_words(text: str) -> frozenset:
+    """Return the lowercased word set of a pattern, memoized per pattern string."""
+    return frozenset(text.lower().split())
+
 class FieldState(Enum):
     """States of field patterns and residues."""
     SURFACED = "surfaced"
@@ -209,19 +221,20 @@ class NeuralField:
         """
         resonance_scores = {}
         
+        # Resolve resonance configuration once rather than per attractor
+        resonance_config = self.config.get('resonance', {})
+        threshold = resonance_config.get('threshold', 0.2)
+        amplification = resonance_config.get('amplification', 1.2)
+        distance_factor = resonance_config.get('distance_factor', 0.5)
+        
         for attractor_id, attractor in self.attractors.items():
             # Calculate semantic similarity (simplified implementation)
             similarity = self._calculate_semantic_similarity(query_pattern, attractor.pattern)
             
-            # Apply resonance configuration
-            resonance_config = self.config.get('resonance', {})
-            threshold = resonance_config.get('threshold', 0.2)
-            amplification = resonance_config.get('amplification', 1.2)
-            
             if similarity >= threshold:
-                # Apply distance decay
-                distance = self._calculate_semantic_distance(query_pattern, attractor.pattern)
-                distance_factor = resonance_config.get('distance_factor', 0.5)
+                # Apply distance decay; semantic distance is the complement
+                # of the similarity already computed
+                distance = 1.0 - similarity
                 distance_decay = np.exp(-distance * distance_factor)
                 
                 # Calculate final resonance score
@@ -312,17 +325,21 @@ class NeuralField:
         """Calculate comprehensive field metrics."""
         metrics = FieldMetrics()
         
+        # Attractor strengths feed both stability and entropy; gather them once
+        strengths = np.fromiter((a.strength for a in self.attractors.values()),
+                                dtype=float, count=len(self.attractors))
+        
         # Coherence: how well-organized the field is
         metrics.coherence = self._calculate_coherence()
         
         # Stability: resistance to change
-        metrics.stability = self._calculate_stability()
+        metrics.stability = self._calculate_stability(strengths)
         
         # Resonance: average resonance strength
         metrics.resonance = self._calculate_average_resonance()
         
         # Entropy: measure of disorder
-        metrics.entropy = self._calculate_field_entropy()
+        metrics.entropy = self._calculate_field_entropy(strengths)
         
         # Counts
         metrics.attractor_count = len(self.attractors)
@@ -337,39 +354,48 @@ class NeuralField:
     
     def apply_field_decay(self):
         """Apply natural decay to all field patterns."""
-        # Decay attractors
-        for attractor_id in list(self.attractors.keys()):
-            attractor = self.attractors[attractor_id]
-            
-            # Apply protection for strong attractors
-            persistence_config = self.config.get('persistence', {})
-            protection = persistence_config.get('attractor_protection', 0.8)
-            
+        # Protection for strong attractors is fixed for the whole pass
+        persistence_config = self.config.get('persistence', {})
+        protection = persistence_config.get('attractor_protection', 0.8)
+        protected_decay_factor = 1 - (self.decay_rate * (1 - protection))
+        decay_factor = 1 - self.decay_rate
+        
+        # Decay attractors, collecting the very weak ones to remove after the
+        # pass instead of copying the keys up front
+        weak_attractor_ids = []
+        for attractor_id, attractor in self.attractors.items():
             if attractor.strength > 0.8:  # Strong attractor
-                decay_factor = 1 - (self.decay_rate * (1 - protection))
+                attractor.strength *= protected_decay_factor
             else:
-                decay_factor = 1 - self.decay_rate
-            
-            attractor.strength *= decay_factor
+                attractor.strength *= decay_factor
             
-            # Remove very weak attractors
             if attractor.strength < 0.01:
-                del self.attractors[attractor_id]
-                logger.debug(f"Removed weak attractor: {attractor_id}")
-        
-        # Decay pattern activations
-        for pattern_id in list(self.pattern_activations.keys()):
-            self.pattern_activations[pattern_id] *= (1 - self.decay_rate)
-            if self.pattern_activations[pattern_id] < 0.01:
-                del self.pattern_activations[pattern_id]
-        
-        # Decay residues
-        for residue_id in list(self.residues.keys()):
-            residue = self.residues[residue_id]
-            residue.strength *= (1 - self.decay_rate * 0.5)  # Slower decay for residues
-            
+                weak_attractor_ids.append(attractor_id)
+        
+        for attractor_id in weak_attractor_ids:
+            del self.attractors[attractor_id]
+            logger.debug(f"Removed weak attractor: {attractor_id}")
+        
+        # Decay pattern activations, keeping only those still above the floor
+        self.pattern_activations = {
+            pattern_id: activation
+            for pattern_id, activation in (
+                (pattern_id, value * decay_factor)
+                for pattern_id, value in self.pattern_activations.items()
+            )
+            if activation >= 0.01
+        }
+        
+        # Decay residues (slower than attractors)
+        residue_decay_factor = 1 - self.decay_rate * 0.5
+        weak_residue_ids = []
+        for residue_id, residue in self.residues.items():
+            residue.strength *= residue_decay_factor
             if residue.strength < 0.1:
-                del self.residues[residue_id]
+                weak_residue_ids.append(residue_id)
+        
+        for residue_id in weak_residue_ids:
+            del self.residues[residue_id]
     
     def strengthen_on_access(self, pattern_id: str):
         """Strengthen patterns when accessed (if enabled)."""
@@ -443,18 +469,51 @@ class NeuralField:
     
     def _calculate_semantic_similarity(self, pattern1: str, pattern2: str) -> float:
         """Calculate semantic similarity between patterns."""
-        # Simplified implementation using word overlap
-        words1 = set(pattern1.lower().split())
-        words2 = set(pattern2.lower().split())
+        # Simplified implementation using word overlap; word sets are cached
+        # because the same attractor patterns are compared on every pass
+        words1 = _pattern_words(pattern1)
+        words2 = _pattern_words(pattern2)
         
         if not words1 or not words2:
             return 0.0
         
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
+        intersection = len(words1 & words2)
+        union = len(words1) + len(words2) - intersection
         
         return intersection / union if union > 0 else 0.0
     
+    def _calculate_similarity_matrix(self, patterns: List[str]) -> np.ndarray:
+        """
+        Calculate semantic similarity between every pair of patterns at once.
+        
+        Each pattern becomes a row of a binary pattern-by-word matrix, so one
+        matrix product yields every word-overlap count and the union sizes
+        follow from the row sums. Entries match _calculate_semantic_similarity.
+        
+        Args:
+            patterns: Patterns to compare
+            
+        Returns:
+            Square matrix of pairwise similarities
+        """
+        vocabulary: Dict[str, int] = {}
+        rows, columns = [], []
+        for row, pattern in enumerate(patterns):
+            for word in _pattern_words(pattern):
+                rows.append(row)
+                columns.append(vocabulary.setdefault(word, len(vocabulary)))
+        
+        membership = np.zeros((len(patterns), len(vocabulary)))
+        membership[rows, columns] = 1.0
+        
+        intersections = membership @ membership.T
+        sizes = membership.sum(axis=1)
+        unions = sizes[:, np.newaxis] + sizes[np.newaxis, :] - intersections
+        
+        # Empty patterns have no union with each other; they score zero
+        return np.divide(intersections, unions, out=np.zeros_like(intersections),
+                         where=unions > 0)
+    
     def _calculate_semantic_distance(self, pattern1: str, pattern2: str) -> float:
         """Calculate semantic distance between patterns."""
         similarity = self._calculate_semantic_similarity(pattern1, pattern2)
@@ -468,14 +527,20 @@ class NeuralField:
         
         # Create influence region
         influence_radius = int(attractor.basin_width * 10)
-        for i in range(max(0, matrix_x - influence_radius), 
-                      min(self.field_matrix.shape[0], matrix_x + influence_radius)):
-            for j in range(max(0, matrix_y - influence_radius),
-                          min(self.field_matrix.shape[1], matrix_y + influence_radius)):
-                distance = np.sqrt((i - matrix_x)**2 + (j - matrix_y)**2)
-                if distance <= influence_radius:
-                    influence = attractor.strength * np.exp(-distance / influence_radius)
-                    self.field_matrix[i, j] += influence
+        row_start = max(0, matrix_x - influence_radius)
+        row_stop = min(self.field_matrix.shape[0], matrix_x + influence_radius)
+        col_start = max(0, matrix_y - influence_radius)
+        col_stop = min(self.field_matrix.shape[1], matrix_y + influence_radius)
+        if row_start >= row_stop or col_start >= col_stop:
+            return
+        
+        # Evaluate the whole window at once; cells outside the radius get nothing
+        rows = np.arange(row_start, row_stop)[:, np.newaxis] - matrix_x
+        cols = np.arange(col_start, col_stop)[np.newaxis, :] - matrix_y
+        distance_sq = rows * rows + cols * cols
+        influence = attractor.strength * np.exp(-np.sqrt(distance_sq) / influence_radius)
+        influence[distance_sq > influence_radius * influence_radius] = 0.0
+        self.field_matrix[row_start:row_stop, col_start:col_stop] += influence
     
     def _process_resonance_effects(self, pattern: str, location: Tuple[float, float], strength: float):
         """Process resonance effects from a new pattern."""
@@ -489,9 +554,10 @@ class NeuralField:
         
         # Amplify resonating attractors
         amplification = resonance_config.get('amplification', 1.2)
+        threshold = resonance_config.get('threshold', 0.2)
         
         for attractor_id, score in resonance_scores.items():
-            if score > resonance_config.get('threshold', 0.2):
+            if score > threshold:
                 attractor = self.attractors[attractor_id]
                 amplification_factor = 1 + (score * (amplification - 1))
                 attractor.strength = min(1.0, attractor.strength * amplification_factor)
@@ -519,12 +585,15 @@ class NeuralField:
     
     def _apply_resonance_scaffold(self, scaffold: Dict[str, Any]):
         """Apply scaffolding effects to the field."""
+        # Index nodes by ID so each connection resolves its ends in O(1)
+        nodes_by_id = {node['id']: node for node in scaffold['nodes']}
+        
         # Amplify patterns connected by scaffold
         for connection in scaffold['connections']:
             strength = connection['strength']
             # Find source and target nodes
-            source_node = next((n for n in scaffold['nodes'] if n['id'] == connection['source']), None)
-            target_node = next((n for n in scaffold['nodes'] if n['id'] == connection['target']), None)
+            source_node = nodes_by_id.get(connection['source'])
+            target_node = nodes_by_id.get(connection['target'])
             
             if source_node and target_node:
                 # Strengthen both attractors
@@ -566,26 +635,20 @@ class NeuralField:
         if len(self.attractors) < 2:
             return 1.0
         
-        # Measure how well attractors are organized
-        total_resonance = 0
-        comparisons = 0
-        
-        attractors_list = list(self.attractors.values())
-        for i, attractor1 in enumerate(attractors_list):
-            for attractor2 in attractors_list[i+1:]:
-                similarity = self._calculate_semantic_similarity(attractor1.pattern, attractor2.pattern)
-                total_resonance += similarity
-                comparisons += 1
-        
-        return total_resonance / comparisons if comparisons > 0 else 0.0
+        # Measure how well attractors are organized: mean similarity over
+        # every distinct pair, read off the upper triangle
+        similarity = self._calculate_similarity_matrix(
+            [attractor.pattern for attractor in self.attractors.values()]
+        )
+        pairs = np.triu_indices(len(similarity), k=1)
+        return float(similarity[pairs].mean())
     
-    def _calculate_stability(self) -> float:
-        """Calculate field stability."""
+    def _calculate_stability(self, strengths: np.ndarray) -> float:
+        """Calculate field stability from the attractor strengths."""
         # Measure based on attractor strengths and distribution
-        if not self.attractors:
+        if not strengths.size:
             return 0.0
         
-        strengths = [a.strength for a in self.attractors.values()]
         stability = np.mean(strengths) * (1 - np.std(strengths))
         return max(0.0, min(1.0, stability))
     
@@ -594,23 +657,33 @@ class NeuralField:
         if len(self.attractors) < 2:
             return 0.0
         
-        total_resonance = 0
-        count = 0
+        resonance_config = self.config.get('resonance', {})
+        threshold = resonance_config.get('threshold', 0.2)
+        amplification = resonance_config.get('amplification', 1.2)
+        distance_factor = resonance_config.get('distance_factor', 0.5)
         
-        for attractor in self.attractors.values():
-            resonance_scores = self.measure_resonance(attractor.pattern)
-            total_resonance += sum(resonance_scores.values())
-            count += len(resonance_scores)
+        # Score every attractor pattern against every attractor at once, as
+        # measure_resonance would per row, masking out pairs below threshold
+        attractors = list(self.attractors.values())
+        similarity = self._calculate_similarity_matrix([a.pattern for a in attractors])
+        strengths = np.fromiter((a.strength for a in attractors), dtype=float, count=len(attractors))
+        
+        resonant = similarity >= threshold
+        if not resonant.any():
+            return 0.0
         
-        return total_resonance / count if count > 0 else 0.0
+        similarities = similarity[resonant]
+        distance_decay = np.exp(-(1.0 - similarities) * distance_factor)
+        target_strengths = np.broadcast_to(strengths, similarity.shape)[resonant]
+        scores = np.minimum(1.0, similarities * amplification * distance_decay * target_strengths)
+        return float(scores.mean())
     
-    def _calculate_field_entropy(self) -> float:
-        """Calculate field entropy (measure of disorder)."""
-        if not self.attractors:
+    def _calculate_field_entropy(self, strengths: np.ndarray) -> float:
+        """Calculate field entropy (measure of disorder) from the attractor strengths."""
+        if not strengths.size:
             return 1.0
         
         # Calculate entropy based on attractor strength distribution
-        strengths = np.array([a.strength for a in self.attractors.values()])
         strengths = strengths / np.sum(strengths)  # Normalize
         
         # Calculate Shannon entropy
@@ -625,11 +698,11 @@ class NeuralField:
         
         # Count attractor tokens
         for attractor in self.attractors.values():
-            total_tokens += len(attractor.pattern.split()) * 2  # Rough estimate
+            total_tokens += _count_words(attractor.pattern) * 2  # Rough estimate
         
         # Count residue tokens
         for residue in self.residues.values():
-            total_tokens += len(residue.content.split())
+            total_tokens += _count_words(residue.content)
         
         return total_tokens
     
@@ -651,10 +724,10 @@ class NeuralField:
         
         # Active attractors
         output.append("## Active Attractors")
-        sorted_attractors = sorted(self.attractors.values(), 
-                                 key=lambda a: a.strength, reverse=True)
+        sorted_attractors = heapq.nlargest(max_attractors, self.attractors.values(),
+                                           key=lambda a: a.strength)
         
-        for attractor in sorted_attractors[:max_attractors]:
+        for attractor in sorted_attractors:
             output.append(f"### {attractor.id}")
             output.append(f"- **Strength**: {attractor.strength:.3f}")
             output.append(f"- **Pattern**: {attractor.pattern}")
@@ -663,10 +736,10 @@ class NeuralField:
         # Symbolic residue
         if self.residues:
             output.append("## Symbolic Residue")
-            sorted_residues = sorted(self.residues.values(),
-                                   key=lambda r: r.strength, reverse=True)
+            sorted_residues = heapq.nlargest(max_residues, self.residues.values(),
+                                             key=lambda r: r.strength)
             
-            for residue in sorted_residues[:max_residues]:
+            for residue in sorted_residues:
                 output.append(f"- **{residue.id}** ({residue.strength:.3f}): {residue.content}")
             output.append("")
         
@@ -685,10 +758,10 @@ class NeuralField:
             data['metrics'] = metrics.to_dict()
         
         # Attractors
-        sorted_attractors = sorted(self.attractors.values(),
-                                 key=lambda a: a.strength, reverse=True)
+        sorted_attractors = heapq.nlargest(max_attractors, self.attractors.values(),
+                                           key=lambda a: a.strength)
         data['attractors'] = []
-        for attractor in sorted_attractors[:max_attractors]:
+        for attractor in sorted_attractors:
             data['attractors'].append({
                 'id': attractor.id,
                 'pattern': attractor.pattern,
@@ -699,10 +772,10 @@ class NeuralField:
         
         # Residues
         if self.residues:
-            sorted_residues = sorted(self.residues.values(),
-                                   key=lambda r: r.strength, reverse=True)
+            sorted_residues = heapq.nlargest(max_residues, self.residues.values(),
+                                             key=lambda r: r.strength)
             data['residues'] = []
-            for residue in sorted_residues[:max_residues]:
+            for residue in sorted_residues:
                 data['residues'].append({
                     'id': residue.id,
                     'content': residue.content,
@@ -725,18 +798,18 @@ class NeuralField:
             output.append("")
         
         output.append("Active Attractors:")
-        sorted_attractors = sorted(self.attractors.values(),
-                                 key=lambda a: a.strength, reverse=True)
+        sorted_attractors = heapq.nlargest(max_attractors, self.attractors.values(),
+                                           key=lambda a: a.strength)
         
-        for attractor in sorted_attractors[:max_attractors]:
+        for attractor in sorted_attractors:
             output.append(f"  {attractor.id} ({attractor.strength:.3f}): {attractor.pattern}")
         
         if self.residues:
             output.append("\nSymbolic Residue:")
-            sorted_residues = sorted(self.residues.values(),
-                                   key=lambda r: r.strength, reverse=True)
+            sorted_residues = heapq.nlargest(max_residues, self.residues.values(),
+                                             key=lambda r: r.strength)
             
-            for residue in sorted_residues[:max_residues]:
+            for residue in sorted_residues:
                 output.append(f"  {residue.id} ({residue.strength:.3f}): {residue.content}")
         
         return "\n".join(output)
@@ -40,10 +40,34 @@ RESPONSIBILITY_TAG = "responsibility"
 REASONING_TAG = "reasoning"
 ANALYSIS_PLAN_TAG = "analysis_plan"
 
+# ====================================================
+# Precompiled Patterns
+# ====================================================
+
+BLANK_LINES_RE = re.compile(r'\n\s*\n')
+# Double quotes nested inside a double-quoted attribute value
+ATTRIBUTE_QUOTES_RE = re.compile(r'(\w+)="([^"]*)"([^"]*)"([^"]*)"')
+ANALYSIS_PLAN_RE = re.compile(r'<analysis_plan>(.*?)</analysis_plan>', re.DOTALL)
+FILE_ASSIGNMENTS_RE = re.compile(r'<file_assignments>(.*?)</file_assignments>', re.DOTALL)
+FILE_PATH_RE = re.compile(r'<file_path>(.*?)</file_path>', re.DOTALL)
+
 # ====================================================
 # Helper Functions
 # ====================================================
 
+def extract_file_paths(section: str) -> List[str]:
+    """
+    Extract the non-empty file paths listed in a section.
+    
+    Args:
+        section: Text containing <file_path> elements
+        
+    Returns:
+        List[str]: Stripped file paths, in document order
+    """
+    paths = (match.group(1).strip() for match in FILE_PATH_RE.finditer(section))
+    return [path for path in paths if path]
+
 def extract_from_json(data: Union[Dict, str]) -> str:
     """
     Extract the plan field from a JSON object or JSON string.
@@ -123,11 +147,11 @@ def extract_xml_content(content: str) -> str:
     if re.search(r'^\s*<reasoning>.*?</reasoning>\s*<analysis_plan>', content, re.DOTALL):
         logger.info("Found both reasoning and analysis_plan tags, wrapping in root element")
         # Clean up empty lines and normalize spacing to avoid parsing issues
-        cleaned_content = re.sub(r'\n\s*\n', '\n', content)
+        cleaned_content = BLANK_LINES_RE.sub('\n', content)
         return f"<root>{cleaned_content}</root>"
     
     # Try to find <analysis_plan> tags
-    plan_match = re.search(r'<analysis_plan>(.*?)</analysis_plan>', content, re.DOTALL)
+    plan_match = ANALYSIS_PLAN_RE.search(content)
     
     # If not found, check for <reasoning> followed by <analysis_plan>
     if not plan_match:
@@ -164,7 +188,7 @@ def clean_and_fix_xml(xml_content: str) -> str:
         return "<analysis_plan></analysis_plan>"
     
     # Remove excessive whitespace and normalize newlines
-    xml_content = re.sub(r'\n\s*\n', '\n', xml_content)
+    xml_content = BLANK_LINES_RE.sub('\n', xml_content)
     
     # Fix non-standard attribute format in agent tags
     # Replace <agent_1="Name"> with <agent_1 name="Name">
@@ -176,9 +200,9 @@ def clean_and_fix_xml(xml_content: str) -> str:
     # Replace any double quotes inside attribute values that are already in double quotes
     # This is a common issue with model-generated XML
     # Look for patterns like name="This is a "quoted" word"
-    quote_pattern = r'(\w+)="([^"]*)"([^"]*)"([^"]*)"'
-    while re.search(quote_pattern, fixed_content):
-        fixed_content = re.sub(quote_pattern, r'\1="\2\'\3\'\4"', fixed_content)
+    replaced = 1
+    while replaced:
+        fixed_content, replaced = ATTRIBUTE_QUOTES_RE.subn(r'\1="\2\'\3\'\4"', fixed_content)
     
     # Fix missing quotes in attribute values
     # Look for patterns like name=Some Value> and change to name="Some Value">
@@ -270,13 +294,13 @@ def extract_agent_fallback(content: str) -> List[Dict]:
     agents = []
     
     # Try to extract full analysis_plan section
-    plan_match = re.search(r'<analysis_plan>(.*?)</analysis_plan>', content, re.DOTALL)
+    plan_match = ANALYSIS_PLAN_RE.search(content)
     if plan_match:
         logger.info("Found analysis_plan section in fallback extraction")
         content = plan_match.group(1)
     
     # Find all file assignment blocks
-    assignment_blocks = re.findall(r'<file_assignments>(.*?)</file_assignments>', content, re.DOTALL)
+    assignment_blocks = FILE_ASSIGNMENTS_RE.findall(content)
     
     # Try to extract agent blocks with full details
     agent_block_pattern = r'<agent_(\d+)[^>]*>.*?<description>(.*?)</description>.*?<file_assignments>(.*?)</file_assignments>'
@@ -301,8 +325,7 @@ def extract_agent_fallback(content: str) -> List[Dict]:
                     agent_name = name_from_desc.group(1).strip() if name_from_desc else f"Agent {num}"
             
             # Extract files
-            file_paths = re.findall(r'<file_path>(.*?)</file_path>', files_section, re.DOTALL)
-            file_paths = [path.strip() for path in file_paths if path.strip()]
+            file_paths = extract_file_paths(files_section)
             
             agent_info = {
                 "id": agent_id,
@@ -337,9 +360,7 @@ def extract_agent_fallback(content: str) -> List[Dict]:
         for i, (agent_id, agent_name) in enumerate(agent_matches):
             file_paths = []
             if i < len(assignment_blocks):
-                block = assignment_blocks[i]
-                file_paths = re.findall(r'<file_path>(.*?)</file_path>', block, re.DOTALL)
-                file_paths = [path.strip() for path in file_paths if path.strip()]
+                file_paths = extract_file_paths(assignment_blocks[i])
             
             # Try to get description
             desc_pattern = f'<{agent_id}[^>]*>.*?<description>(.*?)</description>'
@@ -361,8 +382,7 @@ def extract_agent_fallback(content: str) -> List[Dict]:
     if not agents and assignment_blocks:
         all_files = []
         for block in assignment_blocks:
-            file_paths = re.findall(r'<file_path>(.*?)</file_path>', block, re.DOTALL)
-            all_files.extend([path.strip() for path in file_paths if path.strip()])
+            all_files.extend(extract_file_paths(block))
         
         if all_files:
             agents.append({
@@ -376,7 +396,7 @@ def extract_agent_fallback(content: str) -> List[Dict]:
     
     # Ultra fallback - search for file paths anywhere in the content
     if not agents:
-        last_chance_files = re.findall(r'<file_path>(.*?)</file_path>', content, re.DOTALL)
+        last_chance_files = FILE_PATH_RE.findall(content)
         if last_chance_files:
             logger.info("Last resort extraction found some files")
             agents.append({
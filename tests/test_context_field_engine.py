@@ -69,6 +69,63 @@ class TestContextFieldEngine(unittest.TestCase):
         self.assertEqual(attractor.activation_count, initial_count + 1)
         self.assertIsNotNone(attractor.last_activated)
 
+    def test_batch_attractor_creation(self):
+        """Test batch creation matches creating attractors one at a time."""
+        single = ContextFieldEngine(field_dimensions=(50, 50, 50))
+        concepts = ["batch a", "batch_b"]
+        positions = [(5, 5, 5), (8, 5, 5)]
+        
+        single_ids = [
+            single.create_attractor(concept, AttractorType.INSIGHT, position, 0.3)
+            for concept, position in zip(concepts, positions)
+        ]
+        batch_ids = self.field_engine.create_attractors(
+            concepts, AttractorType.INSIGHT, positions, 0.3
+        )
+        
+        self.assertEqual(batch_ids, single_ids)
+        for attractor_id in batch_ids:
+            self.assertEqual(
+                self.field_engine.attractors[attractor_id].strength,
+                single.attractors[attractor_id].strength
+            )
+        self.assertAlmostEqual(self.field_engine.get_field_energy(), single.get_field_energy())
+        self.assertEqual(
+            [a.id for a in self.field_engine._find_nearby_attractors((6, 5, 5), 3.0)], batch_ids
+        )
+        
+        with self.assertRaises(ValueError):
+            self.field_engine.create_attractors(concepts, AttractorType.INSIGHT, positions[:1])
+        with self.assertRaises(ValueError):
+            self.field_engine.add_symbolic_residues(["⊕"], [], "ctx", [(1, 1, 1)])
+
+    def test_field_elements_use_slots(self):
+        """Test field element dataclasses carry no per-instance __dict__."""
+        residue = SymbolicResidue("r", "⊕", "meaning", "context", (1, 2, 3), 0.1)
+        self.assertFalse(hasattr(residue, "__dict__"))
+        self.assertEqual(residue.strength, 1.0)
+        
+        attractor = next(iter(self.field_engine.attractors.values()))
+        self.assertFalse(hasattr(attractor, "__dict__"))
+        with self.assertRaises(AttributeError):
+            attractor.unknown_field = True
+    
+    def test_nearby_attractor_search(self):
+        """Test spatial queries see attractors and their current strength."""
+        near_id = self.field_engine.create_attractor(
+            "near", AttractorType.INSIGHT, (40, 40, 40), strength=0.4
+        )
+        far_id = self.field_engine.create_attractor(
+            "far", AttractorType.INSIGHT, (40, 40, 61)
+        )
+        
+        nearby = self.field_engine._find_nearby_attractors((40, 40, 45), radius=5.0)
+        self.assertEqual([a.id for a in nearby], [near_id])
+        self.assertNotIn(far_id, [a.id for a in nearby])
+        
+        nearby[0].activate()
+        self.assertAlmostEqual(self.field_engine.attractors[near_id].strength, 0.5)
+
     def test_symbolic_residue_creation(self):
         """Test symbolic residue creation and management."""
         # Create symbolic residue
@@ -106,6 +163,35 @@ class TestContextFieldEngine(unittest.TestCase):
         expected_strength = initial_strength * math.exp(-0.1 * 1.0)
         self.assertAlmostEqual(residue.strength, expected_strength, places=5)
 
+    def test_field_evolution_culls_decayed_residues(self):
+        """Test evolution decays every residue and drops only the weak ones."""
+        fast_id = self.field_engine.add_symbolic_residue(
+            "F", "fast", "test", (10, 10, 10), decay_rate=5.0
+        )
+        slow_id = self.field_engine.add_symbolic_residue(
+            "S", "slow", "test", (10, 10, 10), decay_rate=0.1
+        )
+        fast = self.field_engine.symbolic_residues[fast_id]
+        
+        self.field_engine.evolve_field(time_delta=1.0)
+        
+        self.assertNotIn(fast_id, self.field_engine.symbolic_residues)
+        self.assertAlmostEqual(fast.strength, math.exp(-5.0))
+        self.assertAlmostEqual(
+            self.field_engine.symbolic_residues[slow_id].strength, math.exp(-0.1)
+        )
+
+    def test_symbolic_residue_clustering(self):
+        """Test residues cluster by proximity chains within a shared meaning."""
+        engine = self.field_engine
+        first = engine.add_symbolic_residue("A", "shared", "test", (0, 0, 0), 0.01)
+        chained = engine.add_symbolic_residue("B", "shared", "test", (0, 0, 18), 0.01)
+        middle = engine.add_symbolic_residue("C", "shared", "test", (0, 0, 9), 0.01)
+        engine.add_symbolic_residue("D", "other", "test", (0, 0, 4), 0.01)
+        engine.add_symbolic_residue("E", "shared", "test", (40, 40, 40), 0.01)
+        
+        self.assertEqual(engine._cluster_symbolic_residues(), [[first, chained, middle]])
+
     def test_field_resonance_creation(self):
         """Test field resonance creation and management."""
         # Create some attractors first
@@ -150,6 +236,21 @@ class TestContextFieldEngine(unittest.TestCase):
         self.assertEqual(execution.state, ProtocolState.CONVERGED)
         self.assertTrue(len(execution.created_attractors) > 0)
 
+    def test_protocol_elements_share_start_timestamp(self):
+        """Test elements created by one protocol run are stamped with its start."""
+        engine = self.field_engine
+        execution_id = engine.execute_protocol(
+            "attractor_co_emerge",
+            {"concepts": ["tick_a", "tick_b", "tick_c"]}
+        )
+        
+        execution = engine.protocol_executions[execution_id]
+        self.assertEqual(
+            {engine.attractors[aid].created for aid in execution.created_attractors},
+            {execution.started}
+        )
+        self.assertIsNone(engine._tick_now)
+
     def test_emergent_pattern_detection(self):
         """Test emergent pattern detection."""
         # Create multiple related attractors to form patterns
@@ -166,6 +267,69 @@ class TestContextFieldEngine(unittest.TestCase):
         # Should detect at least some patterns from all the attractors
         self.assertTrue(len(patterns) >= 0)
 
+    def test_attractor_clusters_grow_incrementally(self):
+        """Test new attractors join the first seed in range, not chained members."""
+        engine = self.field_engine
+        seed_id = engine.create_attractor("seed", AttractorType.MEMORY, (200, 200, 200))
+        member_id = engine.create_attractor("member", AttractorType.MEMORY, (225, 200, 200))
+        engine.detect_emergence()
+        
+        # In range of the member but not of the seed, so it starts a new cluster
+        chained_id = engine.create_attractor("chained", AttractorType.MEMORY, (250, 200, 200))
+        late_id = engine.create_attractor("late", AttractorType.MEMORY, (210, 200, 200))
+        
+        clusters = [[a.id for a in cluster] for cluster in engine._find_attractor_clusters()]
+        self.assertIn([seed_id, member_id, late_id], clusters)
+        self.assertNotIn(chained_id, [aid for cluster in clusters for aid in cluster])
+        
+    def test_pattern_detection_is_deferred_until_read(self):
+        """Test a batch of new attractors triggers a single detection on access."""
+        engine = self.field_engine
+        detect = engine._detect_emergent_patterns
+        calls = []
+        
+        def counting_detect():
+            calls.append(1)
+            return detect()
+        
+        engine._detect_emergent_patterns = counting_detect
+        batch_ids = [
+            engine.create_attractor(f"batch_{i}", AttractorType.MEMORY, (300 + i, 300, 300))
+            for i in range(3)
+        ]
+        engine.create_resonance(batch_ids[:2], frequency=1.0, amplitude=0.5)
+        self.assertEqual(calls, [])
+        
+        cluster_patterns = [
+            p for p in engine.emergent_patterns.values() if p.pattern_type == "attractor_cluster"
+        ]
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(any(
+            {f"batch_{i}" for i in range(3)} <= {engine.attractors[e].concept for e in p.elements}
+            for p in cluster_patterns
+        ))
+        
+    def test_emergent_pattern_lifecycle_advances_with_age(self):
+        """Test lifecycle stages advance by age and decay on low stability."""
+        engine = self.field_engine
+        old = EmergentPattern("old", "test", [], 0.5, 0.9)
+        old.created = datetime.now() - timedelta(hours=2)
+        unstable = EmergentPattern("unstable", "test", [], 0.5, 0.1, lifecycle_stage="mature")
+        engine._add_emergent_pattern(old)
+        engine._add_emergent_pattern(unstable)
+        
+        engine._update_emergent_lifecycles()
+        
+        self.assertEqual(old.lifecycle_stage, "stabilizing")
+        self.assertEqual(unstable.lifecycle_stage, "decaying")
+    
+    def test_dominant_attractor_types(self):
+        """Test attractor type counts cover only the types present."""
+        self.assertEqual(
+            self.field_engine._get_dominant_attractor_types(),
+            {"concept": 4, "pattern": 2, "memory": 1}
+        )
+        
     def test_field_coherence_calculation(self):
         """Test field coherence calculation."""
         # Create some resonances to affect coherence
@@ -191,6 +355,28 @@ class TestContextFieldEngine(unittest.TestCase):
         self.assertIsInstance(energy, float)
         self.assertGreater(energy, 0.0)  # Should have some energy from core attractors
 
+    def test_field_aggregates_track_mutations(self):
+        """Test energy and coherence follow element updates and removals."""
+        engine = self.field_engine
+        engine.execute_protocol("attractor_co_emerge", {})
+        engine.execute_protocol("field_resonance_scaffold", {})
+        next(iter(engine.attractors.values())).activate()
+        engine.apply_improvement("enhance_resonance", {})
+        engine.apply_improvement("consolidate_patterns", {})
+        engine.apply_improvement("strengthen_weak_attractors", {"threshold": 0.9})
+        
+        expected_energy = (
+            sum(a.strength for a in engine.attractors.values()) +
+            sum(r.amplitude for r in engine.resonance_patterns.values()) +
+            sum(p.emergence_strength for p in engine.emergent_patterns.values())
+        )
+        expected_coherence = (
+            sum(r.coherence_score for r in engine.resonance_patterns.values()) /
+            len(engine.resonance_patterns)
+        )
+        self.assertAlmostEqual(engine.get_field_energy(), expected_energy)
+        self.assertAlmostEqual(engine.get_field_coherence(), expected_coherence)
+
     def test_field_evolution(self):
         """Test field evolution over time."""
         # Add some residues that will decay
@@ -228,6 +414,15 @@ class TestContextFieldEngine(unittest.TestCase):
         self.assertIn("field_coherence", metrics)
         self.assertIn("field_energy", metrics)
 
+    def test_reflection_history_is_bounded(self):
+        """Test that only the most recent reflections are retained."""
+        engine = ContextFieldEngine(field_dimensions=(50, 50, 50), reflection_history_limit=3)
+        
+        reflections = [engine.self_reflect() for _ in range(5)]
+        
+        self.assertEqual(engine.improvement_cycles, 5)
+        self.assertEqual(list(engine.self_reflection_history), reflections[-3:])
+
     def test_field_improvement(self):
         """Test field improvement application."""
         # Create some weak attractors
@@ -247,6 +442,27 @@ class TestContextFieldEngine(unittest.TestCase):
         final_strength = self.field_engine.attractors[weak_attr_id].strength
         self.assertGreater(final_strength, initial_strength)
 
+    def test_pattern_consolidation_merges_elements(self):
+        """Test consolidation folds similar patterns into the strongest one."""
+        engine = self.field_engine
+        engine.detect_emergence()
+        engine._add_emergent_pattern(EmergentPattern(
+            "merge_weak", "test_merge", ["a", "b", "c"], emergence_strength=0.2, stability=0.5
+        ))
+        engine._add_emergent_pattern(EmergentPattern(
+            "merge_strong", "test_merge", ["d", "b", "c"], emergence_strength=0.6, stability=0.5
+        ))
+        
+        engine.apply_improvement("consolidate_patterns", {})
+        
+        self.assertNotIn("merge_weak", engine.emergent_patterns)
+        strongest = engine.emergent_patterns["merge_strong"]
+        self.assertEqual(strongest.elements, ["d", "b", "c", "a"])
+        self.assertAlmostEqual(strongest.emergence_strength, 0.7)
+        self.assertEqual(
+            engine._trace_causal_relationships()["a"], ["contributes_to_pattern:merge_strong"]
+        )
+
     def test_interpretability_map(self):
         """Test interpretability map generation."""
         # Add some field elements
@@ -284,6 +500,20 @@ class TestContextFieldEngine(unittest.TestCase):
         # Verify all executions were unique
         self.assertEqual(len(execution_ids), len(set(execution_ids)))
 
+    def test_batched_protocol_execution(self):
+        """Test a protocol batch runs in order under one shared timestamp."""
+        execution_ids = self.field_engine.execute_protocols([
+            ("attractor_co_emerge", {"concepts": ["batch_x", "batch_y"]}),
+            ("symbolic_mechanism", {"symbols": ["α"], "meanings": ["start"]})
+        ])
+        
+        executions = [self.field_engine.protocol_executions[eid] for eid in execution_ids]
+        self.assertEqual(
+            [e.protocol_name for e in executions], ["attractor_co_emerge", "symbolic_mechanism"]
+        )
+        self.assertEqual(executions[0].started, executions[1].started)
+        self.assertTrue(all(e.state == ProtocolState.CONVERGED for e in executions))
+
 
 class TestAnalysisContextIntegration(unittest.TestCase):
     """Test the Analysis Context Integration layer."""
@@ -0,0 +1,237 @@
+"""Tests for blueprint generation and Plan Mode integration."""
+
+import asyncio
+import json
+
+import pytest
+
+from cursorrules_architect.core.blueprint import BlueprintIntegration
+from cursorrules_architect.core.blueprint.integration import BlueprintEvaluation
+
+
+class FakeArchitect:
+    """Minimal architect that records the context of each call."""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.prompt_template = "You are {agent_name}"
+        self.contexts = []
+    
+    async def analyze(self, context):
+        self.contexts.append(context)
+        await asyncio.sleep(0)
+        return {"agent": self.name, "findings": "Structured directory tree"}
+
+
+class FakePhase:
+    """Phase executor that runs its architects concurrently, like Phase1Analysis."""
+    
+    def __init__(self, architects):
+        self.architects = architects
+    
+    async def run(self, tree, package_info):
+        results = await asyncio.gather(
+            *(architect.analyze({"tree_structure": tree}) for architect in self.architects)
+        )
+        return {"phase": "Initial Discovery", "findings": results}
+
+
+@pytest.fixture
+def integration(temp_dir):
+    """Create a blueprint integration writing into a temporary directory."""
+    return BlueprintIntegration(str(temp_dir))
+
+
+class TestBlueprintIntegration:
+    """Test blueprint-driven phase execution."""
+    
+    def test_architect_template_is_not_mutated(self, integration):
+        """Enhanced calls receive the template via context, leaving the architect untouched."""
+        architects = [FakeArchitect("a"), FakeArchitect("b")]
+        phase = FakePhase(architects)
+        
+        result = asyncio.run(integration.execute_phase_with_blueprint(
+            "phase1", phase, {"tree_structure": ["main.py"], "package_info": {}}
+        ))
+        
+        assert result["plan_mode"] is True
+        assert json.loads(json.dumps(result))["evaluation"] == result["evaluation"]
+        for architect in architects:
+            assert architect.prompt_template == "You are {agent_name}"
+            context = architect.contexts[-1]
+            assert context["plan_mode"] is True
+            assert context["prompt_template"].startswith("\n# BLUEPRINT CONTEXT")
+            assert context["prompt_template"].endswith("You are {agent_name}")
+    
+    def test_architect_calls_are_bounded_per_provider(self, temp_dir):
+        """No more than max_parallel calls run at once for a provider."""
+        integration = BlueprintIntegration(str(temp_dir), max_parallel=2)
+        active = 0
+        peak = 0
+        
+        class SlowArchitect(FakeArchitect):
+            async def analyze(self, context):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return {}
+        
+        phase = FakePhase([SlowArchitect(str(i)) for i in range(5)])
+        asyncio.run(integration.execute_phase_with_blueprint(
+            "phase1", phase, {"tree_structure": [], "package_info": {}}
+        ))
+        
+        assert peak == 2
+    
+    def test_blueprint_is_reused_for_identical_inputs(self, integration):
+        """Blueprints are generated once per distinct phase/context/requirements."""
+        calls = []
+        generate = integration.generator.generate_blueprint
+        
+        def counting_generate(*args):
+            calls.append(args)
+            return generate(*args)
+        
+        integration.generator.generate_blueprint = counting_generate
+        
+        first = asyncio.run(integration._get_blueprint("phase1", {"a": 1, "b": 2}, None))
+        second = asyncio.run(integration._get_blueprint("phase1", {"b": 2, "a": 1}, None))
+        asyncio.run(integration._get_blueprint("phase1", {"a": 1, "b": 2}, {"time_limit": "1 hour"}))
+        
+        assert len(calls) == 2
+        assert first == second
+    
+    def test_task_completion_searches_nested_findings(self, integration):
+        """Keywords are matched case-insensitively anywhere in nested findings."""
+        blueprint = integration.generator.generate_blueprint("phase2", {})
+        phase_results = {"findings": [{"items": {"notes": ["Resource ALLOCATION done"]}}]}
+        
+        completion = integration._evaluate_task_completion(phase_results, blueprint)
+        
+        assert completion["completed_task_ids"] == ["T2.2"]
+        assert completion["completion_rate"] == 0.5
+    
+    def test_cached_blueprint_is_shared_read_only(self, integration):
+        """Cache hits return the same read-only, JSON-serializable blueprint."""
+        first = asyncio.run(integration._get_blueprint("phase1", {}, None))
+        second = asyncio.run(integration._get_blueprint("phase1", {}, None))
+        
+        assert first is second
+        with pytest.raises(TypeError):
+            first["tasks"] = []
+        with pytest.raises(TypeError):
+            first["metadata"]["phase"] = "phase2"
+        assert json.loads(json.dumps(first))["metadata"]["phase"] == "phase1"
+    
+    def test_phase_results_are_cached_until_invalidated(self, integration):
+        """Opted-in executions reuse results until disabled or invalidated."""
+        architect = FakeArchitect("a")
+        phase = FakePhase([architect])
+        context = {"tree_structure": ["main.py"], "package_info": {}}
+        
+        def execute(**kwargs):
+            return asyncio.run(integration.execute_phase_with_blueprint(
+                "phase1", phase, context, **kwargs
+            ))
+        
+        first = execute(use_cache=True)
+        assert isinstance(first["results"]["findings"], list)
+        first["results"]["findings"].clear()
+        first["evaluation"]["overall_score"] = -1
+        
+        cached = execute(use_cache=True)
+        assert len(cached["results"]["findings"]) == 1
+        assert cached["evaluation"]["overall_score"] > 0
+        with pytest.raises(TypeError, match="read-only"):
+            cached["plan_mode"] = False
+        with pytest.raises(TypeError, match="read-only"):
+            cached["evaluation"]["overall_score"] = -1
+        assert len(architect.contexts) == 1
+        
+        execute()
+        assert len(architect.contexts) == 2
+        
+        integration.invalidate("phase1")
+        execute(use_cache=True)
+        assert len(architect.contexts) == 3
+    
+    def test_cached_results_are_per_executor(self, integration):
+        """A different executor with the same inputs is run rather than served from cache."""
+        first, second = FakeArchitect("a"), FakeArchitect("b")
+        context = {"tree_structure": [], "package_info": {}}
+        
+        for architect in (first, second):
+            asyncio.run(integration.execute_phase_with_blueprint(
+                "phase1", FakePhase([architect]), context, use_cache=True
+            ))
+        
+        assert len(first.contexts) == 1
+        assert len(second.contexts) == 1
+    
+    def test_unserializable_context_is_run_uncached(self, integration):
+        """Contexts that cannot be hashed as JSON still execute, just without caching."""
+        architect = FakeArchitect("a")
+        phase = FakePhase([architect])
+        context = {"tree_structure": [], "package_info": {}, 1: "a", ("x", "y"): 2}
+        
+        for use_cache in (False, True, True):
+            result = asyncio.run(integration.execute_phase_with_blueprint(
+                "phase1", phase, context, use_cache=use_cache
+            ))
+            assert result["plan_mode"] is True
+        
+        assert len(architect.contexts) == 3
+        assert not integration._result_cache and not integration._blueprint_cache
+    
+    def test_blueprint_generation_overlaps_executor_warmup(self, integration):
+        """An executor's warmup coroutine is awaited alongside blueprint generation."""
+        class WarmPhase(FakePhase):
+            warmed = False
+            
+            async def warmup(self):
+                self.warmed = True
+        
+        phase = WarmPhase([FakeArchitect("a")])
+        asyncio.run(integration.execute_phase_with_blueprint(
+            "phase1", phase, {"tree_structure": [], "package_info": {}}
+        ))
+        
+        assert phase.warmed
+    
+    def test_repeated_executions_do_not_stack_wrappers(self, integration):
+        """Re-running a phase re-wraps the original analyze rather than the wrapper."""
+        architect = FakeArchitect("a")
+        original = architect.analyze
+        phase = FakePhase([architect])
+        
+        for _ in range(3):
+            asyncio.run(integration.execute_phase_with_blueprint(
+                "phase1", phase, {"tree_structure": [], "package_info": {}}, use_cache=False
+            ))
+        
+        assert architect.analyze.args[1] == original
+        assert len(architect.contexts) == 3
+    
+    def test_evaluation_is_slotted_and_convertible(self, integration):
+        """Evaluations are slotted records that still convert to plain dicts."""
+        blueprint = integration.generator.generate_blueprint("phase2", {})
+        evaluation = integration._evaluate_against_blueprint({"findings": []}, blueprint)
+        
+        assert isinstance(evaluation, BlueprintEvaluation)
+        assert not hasattr(evaluation, "__dict__")
+        assert evaluation.recommendations
+        assert json.loads(json.dumps(evaluation.asdict()))["overall_score"] == evaluation.overall_score
+    
+    def test_executor_without_architects_skips_enhancement(self, integration, monkeypatch):
+        """No blueprint context is rendered when there is nothing to enhance."""
+        def fail(*args):
+            raise AssertionError("blueprint context rendered")
+        
+        monkeypatch.setattr(integration.generator, "build_blueprint_context", fail)
+        blueprint = integration.generator.generate_blueprint("phase1", {})
+        
+        integration._enhance_architects_with_blueprint(FakePhase([]), blueprint)
+        integration._enhance_architects_with_blueprint(FakePhase(None), blueprint)
+        integration._enhance_architects_with_blueprint(object(), blueprint)